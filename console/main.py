@@ -83,7 +83,7 @@ class Console:
         table.add_column("Parameter", style="cyan")
         table.add_column("Value", style="magenta")
 
-        table.add_row("Accounts", str(len(config.accounts)))
+        table.add_row("Accounts", str(len(config.account_table)))
         table.add_row("Threads", str(config.threads))
         table.add_row(
             "Delay before start",
@@ -0,0 +1,69 @@
+from hexbytes import HexBytes
+from typing import Dict, List, Tuple, TypeAlias
+from web3.types import TxReceipt
+
+AllowanceKey: TypeAlias = Tuple[int, str, str, str]
+
+# keccak("Approval(address,address,uint256)")
+APPROVAL_TOPIC: HexBytes = HexBytes("0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925")
+# approvals of at least this much are treated as unlimited and never run out
+UNLIMITED_ALLOWANCE: int = 2 ** 255
+
+
+class AllowanceCache:
+    """
+    Process-wide ERC-20 allowances keyed by (chain_id, owner, token, spender).
+
+    Filled by reads and by the Approval events of successful receipts. The
+    cached value is a lower bound: an allowance that is about to be spent is
+    deducted right away, so a stale entry can cause an extra read or approve
+    but never a skipped one.
+    """
+    __slots__ = (
+        "_allowances",
+    )
+
+    def __init__(self) -> None:
+        self._allowances: Dict[AllowanceKey, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._allowances)
+
+    @staticmethod
+    def make_key(chain_id: int, owner: str, token: str, spender: str) -> AllowanceKey:
+        return chain_id, owner.lower(), token.lower(), spender.lower()
+
+    def get(self, chain_id: int, owner: str, token: str, spender: str) -> int | None:
+        return self._allowances.get(self.make_key(chain_id, owner, token, spender))
+
+    def set(self, chain_id: int, owner: str, token: str, spender: str, amount: int) -> None:
+        self._allowances[self.make_key(chain_id, owner, token, spender)] = amount
+
+    def spend(self, chain_id: int, owner: str, token: str, spender: str, amount: int) -> None:
+        key: AllowanceKey = self.make_key(chain_id, owner, token, spender)
+        allowance: int | None = self._allowances.get(key)
+        if allowance is not None and allowance < UNLIMITED_ALLOWANCE:
+            self._allowances[key] = max(0, allowance - amount)
+
+    def update_from_receipt(self, chain_id: int, receipt: TxReceipt) -> None:
+        if receipt["status"] != 1:
+            return
+
+        for entry in receipt["logs"]:
+            topics: List[HexBytes] = [HexBytes(topic) for topic in entry["topics"]]
+            if len(topics) != 3 or topics[0] != APPROVAL_TOPIC:
+                continue
+
+            self.set(
+                chain_id,
+                f"0x{topics[1][-20:].hex()}",
+                str(entry["address"]),
+                f"0x{topics[2][-20:].hex()}",
+                int.from_bytes(HexBytes(entry["data"]), "big"),
+            )
+
+    def clear(self) -> None:
+        self._allowances.clear()
+
+
+allowances: AllowanceCache = AllowanceCache()
@@ -0,0 +1,112 @@
+from typing import Any, Dict, Tuple, TypeAlias
+from web3 import AsyncWeb3
+from web3.contract import AsyncContract
+from web3.contract.async_contract import AsyncContractFunction, AsyncContractFunctions
+
+from models import ABI_Type
+
+ContractKey: TypeAlias = Tuple[int, str, str]
+
+
+class BoundContractFunction:
+    """
+    Function of a shared contract that binds its calls to one wallet
+    """
+    __slots__ = (
+        "_function",
+        "_w3",
+    )
+
+    def __init__(self, function: AsyncContractFunction, w3: AsyncWeb3) -> None:
+        self._function: AsyncContractFunction = function
+        self._w3: AsyncWeb3 = w3
+
+    def __call__(self, *args: Any, **kwargs: Any) -> AsyncContractFunction:
+        # web3 copies the function for every call, the copy gets the wallet
+        function: AsyncContractFunction = self._function(*args, **kwargs)
+        function.w3 = self._w3
+        return function
+
+
+class BoundContractFunctions:
+    """
+    contract.functions of a shared contract bound to one wallet
+    """
+    __slots__ = (
+        "_functions",
+        "_w3",
+    )
+
+    def __init__(self, functions: AsyncContractFunctions, w3: AsyncWeb3) -> None:
+        self._functions: AsyncContractFunctions = functions
+        self._w3: AsyncWeb3 = w3
+
+    def __getattr__(self, name: str) -> BoundContractFunction:
+        return BoundContractFunction(getattr(self._functions, name), self._w3)
+
+
+class BoundContract:
+    """
+    Shared contract bound to one wallet: the ABI, selectors and function
+    classes come from the process-wide cache, the wallet only adds its provider
+    """
+    __slots__ = (
+        "contract",
+        "w3",
+        "functions",
+    )
+
+    def __init__(self, contract: AsyncContract, w3: AsyncWeb3) -> None:
+        self.contract: AsyncContract = contract
+        self.w3: AsyncWeb3 = w3
+        self.functions: BoundContractFunctions = BoundContractFunctions(contract.functions, w3)
+
+    @property
+    def address(self) -> str:
+        return self.contract.address
+
+    @property
+    def abi(self) -> ABI_Type:
+        return self.contract.abi
+
+
+class ContractCache:
+    """
+    Process-wide contracts keyed by (chain_id, address, abi_file).
+
+    web3 parses the ABI and creates a class for every contract function each
+    time a contract is built, so the contract is built once, without a
+    provider, and every wallet gets a thin BoundContract over it.
+    """
+    __slots__ = (
+        "_w3",
+        "_contracts",
+    )
+
+    def __init__(self) -> None:
+        self._w3: AsyncWeb3 | None = None
+        self._contracts: Dict[ContractKey, AsyncContract] = {}
+
+    def __len__(self) -> int:
+        return len(self._contracts)
+
+    def get(self, chain_id: int, address: str, abi_file: str, abi: ABI_Type) -> AsyncContract:
+        key: ContractKey = (chain_id, address.lower(), abi_file)
+
+        contract: AsyncContract | None = self._contracts.get(key)
+        if contract is None:
+            if self._w3 is None:
+                # only its ABI codec is used, calls are made by the bound wallet
+                self._w3 = AsyncWeb3()
+            contract = self._w3.eth.contract(address=address, abi=abi)
+            self._contracts[key] = contract
+        return contract
+
+    def bind(self, w3: AsyncWeb3, chain_id: int, address: str, abi_file: str, abi: ABI_Type) -> BoundContract:
+        return BoundContract(self.get(chain_id, address, abi_file, abi), w3)
+
+    def clear(self) -> None:
+        self._contracts.clear()
+
+
+contracts: ContractCache = ContractCache()
@@ -0,0 +1,188 @@
+import sqlite3
+import time
+
+from pathlib import Path
+from typing import Dict, Set, Tuple, TypeAlias
+
+from logger import log
+
+GasProfileKey: TypeAlias = Tuple[int, str, str]
+ContractCodeKey: TypeAlias = Tuple[int, str]
+
+
+class GasProfileStore:
+    """
+    On-disk table of gas used by contract calls, keyed by (chain_id, contract, selector).
+
+    Calls like gm() or mint(1) use almost the same gas on every account, so after
+    the first receipt the learned gasUsed replaces eth_estimateGas. The profile
+    keeps the highest gasUsed seen and is dropped when a transaction with it fails,
+    so the next one is estimated live again.
+
+    Only calls encoded from a contract ABI to an address with code are profiled:
+    raw calldata (e.g. a relay request id sent to a solver) is different on every
+    transaction and would only grow the table. Rows older than ttl are dropped and
+    the table keeps at most max_profiles of the most recently used rows.
+    """
+    __slots__ = (
+        "path",
+        "ttl",
+        "max_profiles",
+        "_connection",
+        "_profiles",
+        "_calls",
+        "_code",
+    )
+
+    def __init__(self,
+                 path: str | Path = Path("./config/data/gas_profiles.sqlite3"),
+                 ttl: float = 7 * 24 * 3600,
+                 max_profiles: int = 10_000,
+                 ) -> None:
+        self.path: Path = Path(path)
+        self.ttl: float = ttl
+        self.max_profiles: int = max_profiles
+        self._connection: sqlite3.Connection | None = None
+        self._profiles: Dict[GasProfileKey, int] = {}
+        self._calls: Set[GasProfileKey] = set()
+        self._code: Dict[ContractCodeKey, bool] = {}
+
+    def __len__(self) -> int:
+        self._connect()
+        return len(self._profiles)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.path,
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS gas_profiles (
+                    chain_id INTEGER NOT NULL,
+                    contract TEXT NOT NULL,
+                    selector TEXT NOT NULL,
+                    gas_used INTEGER NOT NULL,
+                    samples INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (chain_id, contract, selector)
+                ) WITHOUT ROWID
+                """
+            )
+            self._connection.execute("DELETE FROM gas_profiles WHERE updated_at < ?", (time.time() - self.ttl,))
+            self._connection.execute(
+                """
+                DELETE FROM gas_profiles WHERE (chain_id, contract, selector) IN (
+                    SELECT chain_id, contract, selector FROM gas_profiles
+                    ORDER BY updated_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_profiles,),
+            )
+            self._profiles = {
+                (chain_id, contract, selector): gas_used
+                for chain_id, contract, selector, gas_used in self._connection.execute(
+                    "SELECT chain_id, contract, selector, gas_used FROM gas_profiles"
+                )
+            }
+
+        return self._connection
+
+    @staticmethod
+    def make_key(chain_id: int, contract: str | None, data: str | bytes | None) -> GasProfileKey | None:
+        if not contract or not data:
+            return None
+
+        if isinstance(data, bytes):
+            data = data.hex()
+        data = data.removeprefix("0x")
+        if len(data) < 8:
+            return None
+
+        return chain_id, contract.lower(), f"0x{data[:8].lower()}"
+
+    def add_call(self, chain_id: int, contract: str | None, data: str | bytes | None) -> None:
+        """
+        Marks a call encoded from a contract ABI as one that can be profiled
+        """
+        key: GasProfileKey | None = self.make_key(chain_id, contract, data)
+        if key is not None:
+            self._calls.add(key)
+
+    def needs_code(self, chain_id: int, contract: str | None, data: str | bytes | None) -> bool:
+        """
+        Returns True if the call can be profiled but the code of its contract is not checked yet
+        """
+        key: GasProfileKey | None = self.make_key(chain_id, contract, data)
+        return key in self._calls and key[:2] not in self._code
+
+    def set_code(self, chain_id: int, contract: str, code: bytes) -> None:
+        self._code[(chain_id, contract.lower())] = len(code) > 0
+
+    def _get_profiled_key(self, chain_id: int, contract: str | None, data: str | bytes | None) -> GasProfileKey | None:
+        key: GasProfileKey | None = self.make_key(chain_id, contract, data)
+        if key is None or key not in self._calls or not self._code.get(key[:2]):
+            return None
+        return key
+
+    def get(self, chain_id: int, contract: str | None, data: str | bytes | None) -> int | None:
+        key: GasProfileKey | None = self._get_profiled_key(chain_id, contract, data)
+        if key is None:
+            return None
+
+        self._connect()
+        return self._profiles.get(key)
+
+    def learn(self, chain_id: int, contract: str | None, data: str | bytes | None, gas_used: int) -> None:
+        key: GasProfileKey | None = self._get_profiled_key(chain_id, contract, data)
+        if key is None:
+            return
+
+        connection: sqlite3.Connection = self._connect()
+        self._profiles[key] = max(gas_used, self._profiles.get(key, 0))
+        try:
+            connection.execute(
+                """
+                INSERT INTO gas_profiles (chain_id, contract, selector, gas_used, samples, updated_at)
+                VALUES (?, ?, ?, ?, 1, ?)
+                ON CONFLICT (chain_id, contract, selector) DO UPDATE SET
+                    gas_used = MAX(gas_used, excluded.gas_used),
+                    samples = samples + 1,
+                    updated_at = excluded.updated_at
+                """,
+                (*key, gas_used, time.time()),
+            )
+        except sqlite3.Error as error:
+            log.error(f"Failed to save gas profile {key}: {error}")
+
+    def forget(self, chain_id: int, contract: str | None, data: str | bytes | None) -> None:
+        key: GasProfileKey | None = self.make_key(chain_id, contract, data)
+        if key is None:
+            return
+
+        connection: sqlite3.Connection = self._connect()
+        if self._profiles.pop(key, None) is None:
+            return
+        try:
+            connection.execute(
+                "DELETE FROM gas_profiles WHERE chain_id = ? AND contract = ? AND selector = ?",
+                key,
+            )
+        except sqlite3.Error as error:
+            log.error(f"Failed to drop gas profile {key}: {error}")
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._calls.clear()
+        self._code.clear()
+
+
+gas_profiles: GasProfileStore = GasProfileStore()
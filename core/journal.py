@@ -0,0 +1,184 @@
+import re
+import sqlite3
+import time
+import uuid
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal, Tuple
+
+from logger import log
+
+
+JOURNAL_STATUS = Literal[
+    "started",
+    "success",
+    "failed",
+]
+TX_HASH_PATTERN: re.Pattern = re.compile(r"(?:0x)?([0-9a-fA-F]{64})")
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """
+    Journal row of the account run executed by the current task
+
+    Attributes:
+        journal: RunJournal - журнал запусков
+        run_id: str - id запуска
+        module_name: str - название модуля
+        address: str - адрес аккаунта
+    """
+    journal: "RunJournal"
+    run_id: str
+    module_name: str
+    address: str
+
+
+current_entry: ContextVar[JournalEntry | None] = ContextVar("current_entry", default=None)
+
+
+def record_tx_hash(tx_hash: str) -> None:
+    """
+    Saves the hash of a signed transaction to the journal row of the current
+    account run before it is broadcast
+    """
+    entry: JournalEntry | None = current_entry.get()
+    if entry is not None:
+        entry.journal.record_tx(entry.run_id, entry.module_name, entry.address, tx_hash)
+
+
+class RunJournal:
+    """
+    On-disk journal of module executions.
+
+    Every account run is recorded as (run_id, module_name, address) with its
+    status, the hash of its last signed transaction and timestamps. The hash is
+    saved before the transaction is broadcast, so an interrupted "started" row
+    without a hash never sent anything. Each write is committed right away (WAL mode),
+    so the journal survives a crash and a resumed run can skip finished accounts
+    with a primary-key lookup.
+    """
+    __slots__ = (
+        "path",
+        "_connection",
+    )
+
+    def __init__(self, path: str | Path = Path("./config/data/journal.sqlite3")) -> None:
+        self.path: Path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self.path,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def _create_tables(self) -> None:
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                module_name TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS runs_module_idx ON runs (module_name, created_at);
+
+            CREATE TABLE IF NOT EXISTS journal (
+                run_id TEXT NOT NULL,
+                module_name TEXT NOT NULL,
+                address TEXT NOT NULL,
+                status TEXT NOT NULL,
+                tx_hash TEXT,
+                started_at REAL NOT NULL,
+                finished_at REAL,
+                PRIMARY KEY (run_id, module_name, address)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    @staticmethod
+    def extract_tx_hash(message: str) -> str | None:
+        match: re.Match | None = TX_HASH_PATTERN.search(message or "")
+        return f"0x{match.group(1)}" if match else None
+
+    def new_run(self, module_name: str) -> str:
+        run_id: str = uuid.uuid4().hex
+        self._connection.execute(
+            "INSERT INTO runs (run_id, module_name, created_at) VALUES (?, ?, ?)",
+            (run_id, module_name, time.time()),
+        )
+        return run_id
+
+    def last_run(self, module_name: str) -> str | None:
+        row = self._connection.execute(
+            "SELECT run_id FROM runs WHERE module_name = ? ORDER BY created_at DESC LIMIT 1",
+            (module_name,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_entry(self, run_id: str, module_name: str, address: str) -> Tuple[JOURNAL_STATUS | None, str | None]:
+        """
+        Returns the status and the last transaction hash of an account run
+        """
+        row = self._connection.execute(
+            "SELECT status, tx_hash FROM journal WHERE run_id = ? AND module_name = ? AND address = ?",
+            (run_id, module_name, address),
+        ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def start(self, run_id: str, module_name: str, address: str) -> None:
+        try:
+            self._connection.execute(
+                """
+                INSERT INTO journal (run_id, module_name, address, status, started_at)
+                VALUES (?, ?, ?, 'started', ?)
+                ON CONFLICT (run_id, module_name, address) DO UPDATE SET
+                    status = 'started', tx_hash = NULL, started_at = excluded.started_at, finished_at = NULL
+                """,
+                (run_id, module_name, address, time.time()),
+            )
+        except sqlite3.Error as error:
+            log.error(f"Account: {address} | Failed to write journal entry: {error}")
+
+    def record_tx(self, run_id: str, module_name: str, address: str, tx_hash: str) -> None:
+        try:
+            self._connection.execute(
+                "UPDATE journal SET tx_hash = ? WHERE run_id = ? AND module_name = ? AND address = ?",
+                (tx_hash, run_id, module_name, address),
+            )
+        except sqlite3.Error as error:
+            log.error(f"Account: {address} | Failed to write transaction {tx_hash} to the journal: {error}")
+
+    def finish(self,
+               run_id: str,
+               module_name: str,
+               address: str,
+               success: bool,
+               message: str = "",
+               ) -> None:
+        try:
+            self._connection.execute(
+                """
+                UPDATE journal SET status = ?, tx_hash = COALESCE(?, tx_hash), finished_at = ?
+                WHERE run_id = ? AND module_name = ? AND address = ?
+                """,
+                (
+                    "success" if success else "failed",
+                    self.extract_tx_hash(message),
+                    time.time(),
+                    run_id,
+                    module_name,
+                    address,
+                ),
+            )
+        except sqlite3.Error as error:
+            log.error(f"Account: {address} | Failed to write journal entry: {error}")
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from collections import deque
+from typing import Deque, List
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes up a sleeping task.
+
+    Every interval the monitor sleeps and records the time it overslept; any
+    synchronous work on the loop (signing, encoding, parsing) shows up as lag
+    of every coroutine waiting at that moment.
+    """
+    __slots__ = (
+        "interval",
+        "samples",
+        "_task",
+    )
+
+    def __init__(self, interval: float = 0.05, max_samples: int = 10_000) -> None:
+        self.interval: float = interval
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+        self._task: asyncio.Task | None = None
+
+    def percentile(self, percent: float) -> float | None:
+        if not self.samples:
+            return None
+        ordered: List[float] = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def __str__(self) -> str:
+        if not self.samples:
+            return "Event loop lag: n/a"
+        return (
+            f"Event loop lag | p50: {self.percentile(50) * 1000:.1f}ms | "
+            f"p99: {self.percentile(99) * 1000:.1f}ms | max: {max(self.samples) * 1000:.1f}ms"
+        )
+
+    async def _run(self) -> None:
+        while True:
+            started_at: float = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.monotonic() - started_at - self.interval))
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self.samples.clear()
+            self._task = asyncio.create_task(self._run())
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+loop_lag: LoopLagMonitor = LoopLagMonitor()
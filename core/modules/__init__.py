@@ -1,17 +1,40 @@
-from .bridges import BridgeOwltoOPtoInkWorker
-from .bridges import BridgeOwltoInkToOPWorker
-from .bridges import BridgeOwltoBaseToInkWorker
-from .bridges import BridgeOwltoInkToBaseWorker
+import importlib
 
-from .bridges import BridgeRelayOPtoInkWorker
-from .bridges import BridgeRelayInkToOPWorker
-from .bridges import BridgeRelayInkToBaseWorker
-from .bridges import BridgeRelayBaseToInkWorker
+from typing import Any, Callable, Dict, List, Tuple
 
-from .bridges import BridgeGGEthereumToInkWorker
 
-from .others import ClaimDailyGMWorker
-from .others import ZNSDomenWorker
+def lazy_workers(package: str, workers: Dict[str, str]) -> Tuple[List[str], Callable[[str], Any]]:
+    """
+    Returns __all__ and a module __getattr__ that imports each worker of the
+    package from its submodule on first access, so running one module never
+    imports the others
 
-from .mint_nfts import MintParagraphNFTWorker
-from .mint_nfts import RhinoFiNFTWorker
+    Args:
+        package: Package name (__name__)
+        workers: Worker name -> relative module that defines it
+    """
+    def __getattr__(name: str) -> Any:
+        if name in workers:
+            return getattr(importlib.import_module(workers[name], package), name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return list(workers), __getattr__
+
+
+__all__, __getattr__ = lazy_workers(__name__, {
+    "BridgeOwltoOPtoInkWorker": ".bridges",
+    "BridgeOwltoInkToOPWorker": ".bridges",
+    "BridgeOwltoBaseToInkWorker": ".bridges",
+    "BridgeOwltoInkToBaseWorker": ".bridges",
+    "BridgeRelayOPtoInkWorker": ".bridges",
+    "BridgeRelayInkToOPWorker": ".bridges",
+    "BridgeRelayInkToBaseWorker": ".bridges",
+    "BridgeRelayBaseToInkWorker": ".bridges",
+    "BridgeGGEthereumToInkWorker": ".bridges",
+
+    "ClaimDailyGMWorker": ".others",
+    "ZNSDomenWorker": ".others",
+
+    "MintParagraphNFTWorker": ".mint_nfts",
+    "RhinoFiNFTWorker": ".mint_nfts",
+})
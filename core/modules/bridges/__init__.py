@@ -1,11 +1,15 @@
-from .owlto import BridgeOwltoOPtoInkWorker
-from .owlto import BridgeOwltoInkToOPWorker
-from .owlto import BridgeOwltoBaseToInkWorker
-from .owlto import BridgeOwltoInkToBaseWorker
+from core.modules import lazy_workers
 
-from .relay import BridgeRelayOPtoInkWorker
-from .relay import BridgeRelayInkToOPWorker
-from .relay import BridgeRelayBaseToInkWorker
-from .relay import BridgeRelayInkToBaseWorker
+__all__, __getattr__ = lazy_workers(__name__, {
+    "BridgeOwltoOPtoInkWorker": ".owlto",
+    "BridgeOwltoInkToOPWorker": ".owlto",
+    "BridgeOwltoBaseToInkWorker": ".owlto",
+    "BridgeOwltoInkToBaseWorker": ".owlto",
 
-from .bridge_gg import BridgeGGEthereumToInkWorker
+    "BridgeRelayOPtoInkWorker": ".relay",
+    "BridgeRelayInkToOPWorker": ".relay",
+    "BridgeRelayBaseToInkWorker": ".relay",
+    "BridgeRelayInkToBaseWorker": ".relay",
+
+    "BridgeGGEthereumToInkWorker": ".bridge_gg",
+})
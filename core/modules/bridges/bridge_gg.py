@@ -2,9 +2,9 @@ import random
 
 from eth_typing import ChecksumAddress
 from typing import Tuple
-from web3.contract import AsyncContract
 
 from core.exceptions import InsufficientFundsError
+from core.contracts import BoundContract
 from core.wallet import Wallet
 from models import (
     Account,
@@ -21,9 +21,9 @@ class BridgeGGEthereumToInkWorker(Wallet):
                  module_model,
                  ) -> None:
         Wallet.__init__(self,
-            private_key=account.private_key,
+            private_key=account.signer,
             proxy=account.proxy,
-            rpc_url=random.choice(module_model.source_network.rpc),
+            network=module_model.source_network,
         )
 
         self.account: Account = account
@@ -90,7 +90,7 @@ class BridgeGGEthereumToInkWorker(Wallet):
 
                 log.info(f"Account: {self.wallet_address} make {self.module_display_name} using {value} | Save in {self.module_model.source_network_name}: {random_save_amount}")
 
-                contract: AsyncContract = await self.get_contract(self.contract_data)
+                contract: BoundContract = await self.get_contract(self.contract_data)
                 contract_function = contract.functions.bridgeETHTo(*await self._get_data())
                 tx_params = await self.build_transaction_params(
                     contract_function=contract_function,
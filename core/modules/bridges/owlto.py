@@ -3,7 +3,6 @@ import random
 from abc import ABC, abstractmethod
 from typing import Tuple, Self
 from eth_typing import ChecksumAddress
-from web3.contract import AsyncContract
 
 from core.exceptions import InsufficientFundsError
 from interfaces import (
@@ -15,6 +14,7 @@ from interfaces import (
 from loader import config
 from logger import log
 from models import Account, ModuleConfig
+from core.contracts import BoundContract
 from core.wallet import Wallet
 from settings import (
     OwltoContract,
@@ -27,9 +27,9 @@ class BridgeOwltoWorker(Wallet):
                  module_model,
                  ) -> None:
         Wallet.__init__(self,
-                        private_key=account.private_key,
+                        private_key=account.signer,
                         proxy=account.proxy,
-                        rpc_url=random.choice(module_model.source_network.rpc),
+                        network=module_model.source_network,
         )
 
         self.account: Account = account
@@ -111,7 +111,7 @@ class BridgeOwltoWorker(Wallet):
 
                 log.info(f"Account: {self.wallet_address} make {self.module_display_name} using {value} | Save in {self.module_model.source_network_name}: {random_save_amount}")
 
-                contract: AsyncContract = await self.get_contract(self.contract_data)
+                contract: BoundContract = await self.get_contract(self.contract_data)
                 contract_function = contract.functions.deposit(*await self._get_data(
                     value=value, destination=self.destination,
                 ))
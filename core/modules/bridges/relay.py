@@ -22,9 +22,9 @@ class BridgeRelayWorker(Wallet):
                  module_model
                  ) -> None:
         Wallet.__init__(self,
-                        private_key=account.private_key,
+                        private_key=account.signer,
                         proxy=account.proxy,
-                        rpc_url=random.choice(module_model.source_network.rpc),
+                        network=module_model.source_network,
         )
         self.api_client: BaseAPIClient | None = None
 
@@ -1,2 +1,7 @@
-from .paragraph import MintParagraphNFTWorker
-from .rhino_nft import RhinoFiNFTWorker
\ No newline at end of file
+from core.modules import lazy_workers
+
+__all__, __getattr__ = lazy_workers(__name__, {
+    "MintParagraphNFTWorker": ".paragraph",
+
+    "RhinoFiNFTWorker": ".rhino_nft",
+})
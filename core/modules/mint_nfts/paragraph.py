@@ -1,9 +1,9 @@
 import random
 
 from typing import Tuple
-from web3.contract import AsyncContract
 
 from core.exceptions import InsufficientFundsError
+from core.contracts import BoundContract
 from core.wallet import Wallet
 from interfaces import MintNFTParagrafModule
 from loader import config
@@ -18,9 +18,9 @@ class MintParagraphNFTWorker(Wallet):
                  module_model: MintNFTParagrafModule,
                  ) -> None:
         Wallet.__init__(self,
-                        private_key=account.private_key,
+                        private_key=account.signer,
                         proxy=account.proxy,
-                        rpc_url=random.choice(module_model.source_network.rpc),
+                        network=module_model.source_network,
         )
 
         self.account: Account = account
@@ -48,7 +48,7 @@ class MintParagraphNFTWorker(Wallet):
             balance: float = await self.human_balance()
             module_config: ModuleConfig = await config._get_module_settings(self.module_name)
 
-            contract: AsyncContract = await self.get_contract(self.contract_data)
+            contract: BoundContract = await self.get_contract(self.contract_data)
             token_balance = contract.functions.balanceOf(self.wallet_address).call()
 
             if token_balance > 0:
@@ -1,9 +1,9 @@
 import random
 
 from typing import Tuple
-from web3.contract import AsyncContract
 
 from core.exceptions import InsufficientFundsError
+from core.contracts import BoundContract
 from core.wallet import Wallet
 from interfaces import RhinoNFTModule
 from loader import config
@@ -18,9 +18,9 @@ class RhinoFiNFTWorker(Wallet):
                  module_model: RhinoNFTModule,
                  ) -> None:
         Wallet.__init__(self,
-                        private_key=account.private_key,
+                        private_key=account.signer,
                         proxy=account.proxy,
-                        rpc_url=random.choice(module_model.source_network.rpc),
+                        network=module_model.source_network,
         )
 
         self.account: Account = account
@@ -47,7 +47,7 @@ class RhinoFiNFTWorker(Wallet):
 
         try:
             balance: float = await self.human_balance()
-            contract: AsyncContract = await self.get_contract(self.contract_data)
+            contract: BoundContract = await self.get_contract(self.contract_data)
             token_balance = await contract.functions.balanceOf(self.wallet_address, 1).call()
 
             if token_balance >= 1:
@@ -1,2 +1,7 @@
-from .claim_daily_gm import ClaimDailyGMWorker
-from .zns_domen import ZNSDomenWorker
+from core.modules import lazy_workers
+
+__all__, __getattr__ = lazy_workers(__name__, {
+    "ClaimDailyGMWorker": ".claim_daily_gm",
+
+    "ZNSDomenWorker": ".zns_domen",
+})
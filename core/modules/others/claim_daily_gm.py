@@ -3,9 +3,9 @@ import ua_generator
 
 from datetime import datetime, timedelta
 from typing import Any, Dict, Self, Tuple
-from web3.contract import AsyncContract
 
 from core.api import BaseAPIClient
+from core.contracts import BoundContract
 from core.wallet import Wallet
 from core.exceptions import InsufficientFundsError
 from models import Account, ModuleConfig
@@ -23,9 +23,9 @@ class ClaimDailyGMWorker(Wallet):
                  module_model: ClaimDailyGMModule,
                  ) -> None:
         Wallet.__init__(self,
-                        private_key=account.private_key,
+                        private_key=account.signer,
                         proxy=account.proxy,
-                        rpc_url=random.choice(module_model.source_network.rpc),
+                        network=module_model.source_network,
         )
         self.api_client: BaseAPIClient | None = None
 
@@ -136,7 +136,7 @@ class ClaimDailyGMWorker(Wallet):
                     )
                     return True, msg
 
-                contract: AsyncContract = await self.get_contract(self.contract_data)
+                contract: BoundContract = await self.get_contract(self.contract_data)
                 contract_function = contract.functions.gm()
 
                 tx_params = await self.build_transaction_params(
@@ -4,10 +4,10 @@ import re
 import ua_generator
 
 from typing import Any, Dict, Self, Tuple
-from web3.contract import AsyncContract
 
 from core.api import BaseAPIClient
 from core.exceptions import InsufficientFundsError
+from core.contracts import BoundContract
 from core.wallet import Wallet
 from models import Account, ModuleConfig
 from loader import config
@@ -20,9 +20,9 @@ class ZNSDomenWorker(Wallet):
                  module_model,
                  ) -> None:
         Wallet.__init__(self,
-                        private_key=account.private_key,
+                        private_key=account.signer,
                         proxy=account.proxy,
-                        rpc_url=random.choice(module_model.source_network.rpc),
+                        network=module_model.source_network,
         )
         self.api_client: BaseAPIClient | None = None
 
@@ -114,7 +114,7 @@ class ZNSDomenWorker(Wallet):
                     )
                     return True, msg
 
-                contract: AsyncContract = await self.get_contract(self.contract_data)
+                contract: BoundContract = await self.get_contract(self.contract_data)
                 
                 faker_name = False
 
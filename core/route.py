@@ -0,0 +1,78 @@
+import random
+
+from dataclasses import dataclass
+from typing import Iterable, List
+
+from core.exceptions import ConfigurationError
+from models import Account
+
+
+@dataclass(slots=True)
+class Route:
+    """
+    Sequence of modules executed for one account
+
+    Attributes:
+        account: Account - аккаунт, для которого построен маршрут
+        address: str - адрес аккаунта
+        modules: List[str] - модули маршрута в порядке выполнения
+        step: int - индекс текущего модуля
+    """
+    account: Account
+    address: str
+    modules: List[str]
+    step: int = 0
+
+    @property
+    def module(self) -> str:
+        return self.modules[self.step]
+
+    @property
+    def finished(self) -> bool:
+        return self.step >= len(self.modules)
+
+    def advance(self) -> bool:
+        self.step += 1
+        return not self.finished
+
+    def __str__(self) -> str:
+        return " -> ".join(self.modules)
+
+
+class RouteGenerator:
+    """
+    Builds a randomized module sequence per account.
+
+    The generator is seeded with the run id and the account address, so the
+    same run always rebuilds the same route for an account (used by --resume).
+    """
+    __slots__ = (
+        "modules",
+        "min_count",
+        "max_count",
+    )
+
+    def __init__(self,
+                 modules: Iterable[str],
+                 available_modules: Iterable[str],
+                 min_count: int,
+                 max_count: int,
+                 ) -> None:
+        available: List[str] = sorted(available_modules)
+        self.modules: List[str] = list(modules) or available
+
+        unknown: List[str] = [module for module in self.modules if module not in available]
+        if unknown:
+            raise ConfigurationError(f"Smart route contains not implemented modules: {', '.join(unknown)}")
+
+        self.min_count: int = min(min_count, len(self.modules))
+        self.max_count: int = min(max_count, len(self.modules))
+
+    def generate(self, account: Account, address: str, run_id: str) -> Route:
+        rng: random.Random = random.Random(f"{run_id}:{address}")
+        count: int = rng.randint(self.min_count, self.max_count)
+        return Route(
+            account=account,
+            address=address,
+            modules=rng.sample(self.modules, count),
+        )
@@ -0,0 +1,25 @@
+from .chain_state import ChainState
+from .chain_state import ChainStateCache
+from .chain_state import ChainStateRegistry
+from .chain_state import chain_states
+from .heads import NewHeadsListener
+from .heads import NewHeadsRegistry
+from .heads import new_heads
+from .limits import RateLimiterRegistry
+from .limits import rate_limits
+from .nonces import NonceManager
+from .nonces import nonce_manager
+from .provider import SharedHTTPProvider
+from .receipts import ReceiptWatcher
+from .receipts import ReceiptWatcherRegistry
+from .receipts import receipt_watchers
+from .router import EndpointStats
+from .router import RPCRouter
+from .router import RPCRouterRegistry
+from .router import rpc_routers
+from .sessions import RPCSessionPool
+from .sessions import rpc_session_pool
+from .singleflight import RequestCoalescer
+from .singleflight import get_cacheability
+from .singleflight import is_read
+from .singleflight import request_coalescer
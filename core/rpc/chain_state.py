@@ -0,0 +1,128 @@
+import asyncio
+import time
+
+from dataclasses import dataclass
+from typing import Dict
+from web3 import AsyncWeb3
+from web3.types import BlockData
+
+from logger import log
+from utils.networks import Network
+
+
+@dataclass(slots=True)
+class ChainState:
+    """
+    Snapshot of the latest block and fee data of a network
+
+    Attributes:
+        block_number: int - номер последнего блока
+        base_fee: int | None - baseFeePerGas последнего блока (None для сетей без EIP-1559)
+        priority_fee: int | None - max priority fee (только для EIP-1559)
+        gas_price: int | None - gas price (только для сетей без EIP-1559)
+        fetched_at: float - время получения (time.monotonic)
+    """
+    block_number: int
+    base_fee: int | None
+    priority_fee: int | None
+    gas_price: int | None
+    fetched_at: float
+
+
+class ChainStateCache:
+    """
+    Latest block and fee data of one network shared by all wallets on it.
+
+    The state is refreshed at most once per block time: the first wallet that
+    finds it stale fetches it with a single batched request, concurrent callers
+    wait for that refresh instead of sending their own.
+    """
+    __slots__ = (
+        "network",
+        "ttl",
+        "_state",
+        "_lock",
+    )
+
+    def __init__(self, network: Network, ttl: float | None = None) -> None:
+        self.network: Network = network
+        self.ttl: float = network.block_time if ttl is None else ttl
+        self._state: ChainState | None = None
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def state(self) -> ChainState | None:
+        return self._state
+
+    @property
+    def is_fresh(self) -> bool:
+        return self._state is not None and time.monotonic() - self._state.fetched_at < self.ttl
+
+    def invalidate(self) -> None:
+        self._state = None
+
+    def push(self, state: ChainState) -> None:
+        if self._state is None or state.block_number >= self._state.block_number:
+            self._state = state
+
+    async def _fetch(self, w3: AsyncWeb3) -> ChainState:
+        fee_request = w3.eth.max_priority_fee if self.network.eip1559_support else w3.eth.gas_price
+
+        try:
+            async with w3.batch_requests() as batch:
+                batch.add(w3.eth.get_block("latest"))
+                batch.add(fee_request)
+                latest_block, fee = await batch.async_execute()
+        except Exception as error:
+            log.warning(f"{self.network.name} | Batched chain state request failed, retrying sequentially: {error}")
+            latest_block: BlockData = await w3.eth.get_block("latest")
+            fee: int = await (w3.eth.max_priority_fee if self.network.eip1559_support else w3.eth.gas_price)
+
+        return ChainState(
+            block_number=latest_block["number"],
+            base_fee=latest_block.get("baseFeePerGas"),
+            priority_fee=fee if self.network.eip1559_support else None,
+            gas_price=None if self.network.eip1559_support else fee,
+            fetched_at=time.monotonic(),
+        )
+
+    async def get(self, w3: AsyncWeb3) -> ChainState:
+        if self.is_fresh:
+            return self._state
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if not self.is_fresh:
+                self._state = await self._fetch(w3)
+
+        return self._state
+
+
+class ChainStateRegistry:
+    """
+    Process-wide chain state caches keyed by chain id
+    """
+    __slots__ = (
+        "_caches",
+    )
+
+    def __init__(self) -> None:
+        self._caches: Dict[int, ChainStateCache] = {}
+
+    def __len__(self) -> int:
+        return len(self._caches)
+
+    def get(self, network: Network) -> ChainStateCache:
+        cache: ChainStateCache | None = self._caches.get(network.chain_id)
+        if cache is None:
+            cache = ChainStateCache(network)
+            self._caches[network.chain_id] = cache
+        return cache
+
+    def clear(self) -> None:
+        self._caches.clear()
+
+
+chain_states: ChainStateRegistry = ChainStateRegistry()
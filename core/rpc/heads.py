@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+from typing import Any, Dict
+from web3 import AsyncWeb3, WebSocketProvider
+
+from logger import log
+from utils.networks import Network
+from .chain_state import ChainState, ChainStateCache, chain_states
+from .receipts import receipt_watchers
+
+
+class NewHeadsListener:
+    """
+    Persistent WebSocket connection of one network subscribed to newHeads.
+
+    Every new head is pushed into the shared chain state and wakes up the
+    receipt watcher, so neither of them polls over HTTP while the socket is up.
+    If the socket drops, the caches fall back to their HTTP refresh and the
+    listener reconnects with a growing backoff.
+    """
+    __slots__ = (
+        "network",
+        "url",
+        "connected",
+        "_task",
+    )
+    MAX_BACKOFF: float = 30
+
+    def __init__(self, network: Network, url: str) -> None:
+        self.network: Network = network
+        self.url: str = url
+        self.connected: bool = False
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _on_head(self, w3: AsyncWeb3, head: Dict[str, Any]) -> None:
+        fee: int = await (w3.eth.max_priority_fee if self.network.eip1559_support else w3.eth.gas_price)
+
+        chain_states.get(self.network).push(ChainState(
+            block_number=head["number"],
+            base_fee=head.get("baseFeePerGas"),
+            priority_fee=fee if self.network.eip1559_support else None,
+            gas_price=None if self.network.eip1559_support else fee,
+            fetched_at=time.monotonic(),
+        ))
+        receipt_watchers.get(self.network).notify()
+
+    async def _listen(self) -> None:
+        cache: ChainStateCache = chain_states.get(self.network)
+
+        async with AsyncWeb3(WebSocketProvider(self.url)) as w3:
+            await w3.eth.subscribe("newHeads")
+            log.info(f"{self.network.name} | Subscribed to new heads over WebSocket")
+
+            self.connected = True
+            cache.ttl = self.network.block_time * 2
+            try:
+                async for message in w3.socket.process_subscriptions():
+                    await self._on_head(w3, message["result"])
+            finally:
+                self.connected = False
+                cache.ttl = self.network.block_time
+
+    async def _run(self) -> None:
+        backoff: float = 1
+
+        while True:
+            started_at: float = time.monotonic()
+            try:
+                await self._listen()
+                log.warning(f"{self.network.name} | WebSocket closed, falling back to HTTP polling")
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                log.warning(f"{self.network.name} | WebSocket failed, falling back to HTTP polling: {error}")
+
+            if time.monotonic() - started_at > self.MAX_BACKOFF:
+                backoff = 1
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.MAX_BACKOFF)
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
+
+
+class NewHeadsRegistry:
+    """
+    Process-wide newHeads listeners keyed by chain id
+    """
+    __slots__ = (
+        "_listeners",
+    )
+
+    def __init__(self) -> None:
+        self._listeners: Dict[int, NewHeadsListener] = {}
+
+    def __len__(self) -> int:
+        return len(self._listeners)
+
+    def start(self, network: Network, url: str) -> NewHeadsListener:
+        listener: NewHeadsListener | None = self._listeners.get(network.chain_id)
+        if listener is None:
+            listener = NewHeadsListener(network, url)
+            self._listeners[network.chain_id] = listener
+        listener.start()
+        return listener
+
+    async def close(self) -> None:
+        listeners, self._listeners = list(self._listeners.values()), {}
+        for listener in listeners:
+            await listener.close()
+
+
+new_heads: NewHeadsRegistry = NewHeadsRegistry()
@@ -0,0 +1,66 @@
+import asyncio_throttle
+
+from better_proxy import Proxy
+from typing import Dict, Tuple, TypeAlias
+from urllib.parse import urlparse
+
+LimiterKey: TypeAlias = Tuple[str, str]
+RateLimit: TypeAlias = Tuple[int, float]
+
+
+class RateLimiterRegistry:
+    """
+    Process-wide request budgets shared by all wallets.
+
+    Every HTTP request to an RPC waits for the budget of the RPC host (limit of
+    the network the host serves) and, if the wallet uses a proxy, for the budget
+    of that proxy. Wallets of one endpoint share a single limiter, so the total
+    rate stays under the endpoint quota no matter how many accounts run.
+    """
+    __slots__ = (
+        "network_limits",
+        "proxy_limit",
+        "_limiters",
+    )
+
+    def __init__(self) -> None:
+        self.network_limits: Dict[int, RateLimit] = {}
+        self.proxy_limit: RateLimit | None = None
+        self._limiters: Dict[LimiterKey, asyncio_throttle.Throttler] = {}
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+    def configure(self,
+                  network_limits: Dict[int, RateLimit],
+                  proxy_limit: RateLimit | None = None,
+                  ) -> None:
+        self.network_limits = dict(network_limits)
+        self.proxy_limit = proxy_limit
+        self._limiters.clear()
+
+    def _get_limiter(self, key: LimiterKey, limit: RateLimit) -> asyncio_throttle.Throttler:
+        limiter: asyncio_throttle.Throttler | None = self._limiters.get(key)
+        if limiter is None:
+            rate_limit, period = limit
+            limiter = asyncio_throttle.Throttler(rate_limit=rate_limit, period=period)
+            self._limiters[key] = limiter
+        return limiter
+
+    async def acquire(self, rpc_url: str, proxy: Proxy | str | None = None, chain_id: int | None = None) -> None:
+        network_limit: RateLimit | None = self.network_limits.get(chain_id) if chain_id is not None else None
+        if network_limit:
+            async with self._get_limiter(("host", urlparse(str(rpc_url)).netloc), network_limit):
+                pass
+
+        if proxy and self.proxy_limit:
+            async with self._get_limiter(("proxy", proxy.as_url if isinstance(proxy, Proxy) else proxy), self.proxy_limit):
+                pass
+
+    def clear(self) -> None:
+        self.network_limits.clear()
+        self.proxy_limit = None
+        self._limiters.clear()
+
+
+rate_limits: RateLimiterRegistry = RateLimiterRegistry()
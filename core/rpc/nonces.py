@@ -0,0 +1,82 @@
+from typing import Dict, Set, Tuple, TypeAlias
+
+from web3.types import Nonce
+
+NonceKey: TypeAlias = Tuple[int, str]
+
+
+class NonceManager:
+    """
+    Process-wide nonce allocator keyed by (chain_id, address).
+
+    Each address is seeded once with its `pending` transaction count, after that
+    nonces are handed out locally, so an account can have several transactions
+    in flight without asking the RPC before each of them. Nonces of transactions
+    that were never broadcast are released and handed out again first, so no gap
+    blocks the following transactions. After a rejected nonce ("nonce too low",
+    "nonce too high", "replacement transaction underpriced") or a receipt timeout
+    the address is resynced with its pending transaction count.
+    """
+    __slots__ = (
+        "_next",
+        "_released",
+    )
+
+    def __init__(self) -> None:
+        self._next: Dict[NonceKey, int] = {}
+        self._released: Dict[NonceKey, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._next)
+
+    @staticmethod
+    def make_key(chain_id: int, address: str) -> NonceKey:
+        return chain_id, address.lower()
+
+    def is_seeded(self, chain_id: int, address: str) -> bool:
+        return self.make_key(chain_id, address) in self._next
+
+    def seed(self, chain_id: int, address: str, nonce: int) -> None:
+        self._next.setdefault(self.make_key(chain_id, address), nonce)
+
+    def allocate(self, chain_id: int, address: str) -> Nonce:
+        key: NonceKey = self.make_key(chain_id, address)
+        if key not in self._next:
+            raise KeyError(f"Nonce of {address} on chain {chain_id} is not seeded")
+
+        released: Set[int] | None = self._released.get(key)
+        if released:
+            nonce: int = min(released)
+            released.discard(nonce)
+            return Nonce(nonce)
+
+        nonce = self._next[key]
+        self._next[key] = nonce + 1
+        return Nonce(nonce)
+
+    def release(self, chain_id: int, address: str, nonce: int) -> None:
+        """
+        Returns the nonce of a transaction that was not broadcast
+        """
+        key: NonceKey = self.make_key(chain_id, address)
+        if key not in self._next or nonce >= self._next[key]:
+            return
+
+        released: Set[int] = self._released.setdefault(key, set())
+        released.add(nonce)
+
+        while self._next[key] - 1 in released:
+            self._next[key] -= 1
+            released.discard(self._next[key])
+
+    def resync(self, chain_id: int, address: str, nonce: int) -> None:
+        key: NonceKey = self.make_key(chain_id, address)
+        self._next[key] = nonce
+        self._released.pop(key, None)
+
+    def clear(self) -> None:
+        self._next.clear()
+        self._released.clear()
+
+
+nonce_manager: NonceManager = NonceManager()
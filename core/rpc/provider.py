@@ -0,0 +1,202 @@
+import asyncio
+import time
+
+from aiohttp import ClientError
+from better_proxy import Proxy
+from hexbytes import HexBytes
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple, TypeVar, Union
+from web3 import AsyncHTTPProvider
+from web3.exceptions import Web3RPCError
+from web3.types import RPCEndpoint, RPCResponse
+
+from logger import log
+
+from .limits import rate_limits
+from .router import RPCRouter
+from .sessions import rpc_session_pool
+from .singleflight import is_read, request_coalescer
+
+T = TypeVar("T")
+
+FAILOVER_ERRORS = (
+    ClientError,
+    asyncio.TimeoutError,
+)
+ALREADY_KNOWN_ERRORS = (
+    "already known",
+    "known transaction",
+    "already imported",
+    "already in mempool",
+)
+# broadcasts still running after the first endpoint accepted the transaction
+_background_broadcasts: Set[asyncio.Task] = set()
+
+
+class SharedHTTPProvider(AsyncHTTPProvider):
+    """
+    AsyncHTTPProvider sharing process-wide state with the other wallets:
+    identical reads in flight are coalesced (see RequestCoalescer), every
+    HTTP request, single or batch, waits for the budget of its RPC host and
+    proxy (see RateLimiterRegistry), and with a router the provider reports
+    latencies, moves to another endpoint when a request fails and, if hedging
+    is enabled, sends slow reads to a second endpoint (see RPCRouter)
+    """
+
+    def __init__(self,
+                 endpoint_uri: str,
+                 proxy: Proxy | None = None,
+                 chain_id: int | None = None,
+                 router: RPCRouter | None = None,
+                 **kwargs: Any,
+                 ) -> None:
+        super().__init__(endpoint_uri=endpoint_uri, **kwargs)
+        self.proxy: Proxy | None = proxy
+        self.chain_id: int | None = chain_id
+        self.router: RPCRouter | None = router
+
+    async def use_endpoint(self, endpoint_uri: str) -> None:
+        self.endpoint_uri = endpoint_uri
+        await self.cache_async_session(await rpc_session_pool.get(endpoint_uri, self.proxy))
+
+    async def _with_failover(self, send: Callable[[], Awaitable[T]]) -> T:
+        attempts: int = len(self.router.endpoints) if self.router else 1
+
+        for attempt in range(attempts):
+            endpoint_uri: str = str(self.endpoint_uri)
+            started_at: float = time.monotonic()
+            try:
+                await rate_limits.acquire(endpoint_uri, self.proxy, self.chain_id)
+                result: T = await send()
+            except FAILOVER_ERRORS as error:
+                if not self.router:
+                    raise
+
+                self.router.record_failure(endpoint_uri, error)
+                if attempt == attempts - 1:
+                    raise
+                await self.use_endpoint(self.router.choose(exclude={endpoint_uri}))
+                continue
+
+            if self.router:
+                self.router.record_success(endpoint_uri, time.monotonic() - started_at)
+            return result
+
+    async def _post(self, endpoint_uri: str, request_data: bytes) -> bytes:
+        """
+        Posts the request to the given endpoint instead of the current one
+        """
+        await self._request_session_manager.async_cache_and_return_session(
+            endpoint_uri, await rpc_session_pool.get(endpoint_uri, self.proxy)
+        )
+        await rate_limits.acquire(endpoint_uri, self.proxy, self.chain_id)
+
+        started_at: float = time.monotonic()
+        try:
+            response: bytes = await self._request_session_manager.async_make_post_request(
+                endpoint_uri, request_data, **self.get_request_kwargs()
+            )
+        except Exception as error:
+            if self.router:
+                self.router.record_failure(endpoint_uri, error)
+            raise
+
+        if self.router:
+            self.router.record_success(endpoint_uri, time.monotonic() - started_at)
+        return response
+
+    async def _hedged_request(self, method: RPCEndpoint, request_data: bytes) -> bytes:
+        """
+        Sends the read to the current endpoint and, if it is not answered within
+        the hedge delay, to a second one as well; the first answer wins
+        """
+        primary_uri: str = str(self.endpoint_uri)
+        delay: float | None = self.router.hedge_delay(primary_uri) if self.router and is_read(method) else None
+        if delay is None:
+            return await super()._make_request(method, request_data)
+
+        primary: asyncio.Task = asyncio.create_task(super()._make_request(method, request_data))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        secondary_uri: str = self.router.choose(exclude={primary_uri})
+        if secondary_uri == primary_uri:
+            return await primary
+
+        self.router.endpoints[primary_uri].hedged += 1
+        secondary: asyncio.Task = asyncio.create_task(self._post(secondary_uri, request_data))
+        pending = {primary, secondary}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            return await primary
+        finally:
+            for task in (primary, secondary):
+                task.cancel()
+
+    async def _send_raw_transaction_to(self, endpoint_uri: str, request_data: bytes) -> str:
+        response: RPCResponse = self.decode_rpc_response(await self._post(endpoint_uri, request_data))
+
+        error: Dict[str, Any] | None = response.get("error")
+        if error and not any(known in str(error.get("message", "")).lower() for known in ALREADY_KNOWN_ERRORS):
+            raise Web3RPCError(str(error), rpc_response=response)
+
+        return endpoint_uri
+
+    async def broadcast_raw_transaction(self, raw_transaction: HexBytes) -> str:
+        """
+        Sends the signed transaction to every healthy endpoint of the network at once.
+        Returns the endpoint that accepted it first ("already known" counts as accepted);
+        the other broadcasts keep running in the background. Raises the error of the
+        current endpoint if none accepted it.
+        """
+        endpoints: List[str] = self.router.healthy_endpoints() if self.router else [str(self.endpoint_uri)]
+        request_data: bytes = self.encode_rpc_request(
+            RPCEndpoint("eth_sendRawTransaction"), [raw_transaction.to_0x_hex()]
+        )
+        tasks: Dict[asyncio.Task, str] = {
+            asyncio.create_task(self._send_raw_transaction_to(endpoint_uri, request_data)): endpoint_uri
+            for endpoint_uri in endpoints
+        }
+
+        errors: Dict[str, BaseException] = {}
+        pending: Set[asyncio.Task] = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    accepted_by: str = task.result()
+                    if self.router and accepted_by in self.router.endpoints:
+                        self.router.endpoints[accepted_by].first_accepted += 1
+
+                    for background in pending:
+                        _background_broadcasts.add(background)
+                        background.add_done_callback(_background_broadcasts.discard)
+                        background.add_done_callback(lambda finished: finished.cancelled() or finished.exception())
+                    return accepted_by
+
+                errors[tasks[task]] = task.exception()
+
+        log.debug(f"Broadcast rejected by every endpoint: {errors}")
+        raise errors.get(str(self.endpoint_uri)) or next(iter(errors.values()))
+
+    async def _make_request(self, method: RPCEndpoint, request_data: bytes) -> bytes:
+        return await self._with_failover(lambda: self._hedged_request(method, request_data))
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return await request_coalescer.request(
+            self.endpoint_uri,
+            method,
+            params,
+            lambda: super(SharedHTTPProvider, self).make_request(method, params),
+        )
+
+    async def make_batch_request(
+        self, batch_requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        return await self._with_failover(
+            lambda: super(SharedHTTPProvider, self).make_batch_request(batch_requests)
+        )
@@ -0,0 +1,173 @@
+import asyncio
+import time
+
+from hexbytes import HexBytes
+from typing import Any, Dict, List
+from web3 import AsyncWeb3
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt
+
+from logger import log
+from utils.networks import Network
+from .chain_state import ChainState, chain_states
+
+
+class ReceiptWatcher:
+    """
+    Single receipt poller of one network.
+
+    Callers register their transaction hashes and await a future; the watcher
+    checks all pending hashes with one batched request per new block and
+    resolves the futures as receipts appear. The poll interval follows the
+    observed block time of the chain (EWMA), starting from Network.block_time;
+    a newHeads subscription wakes the watcher up on every block instead.
+    Several callers may wait for the same hash; it is polled until the receipt
+    appears or the last of them gives up.
+    """
+    __slots__ = (
+        "network",
+        "batch_size",
+        "interval",
+        "_w3",
+        "_pending",
+        "_waiters",
+        "_task",
+        "_new_block",
+        "_last_block",
+        "_last_block_at",
+    )
+    SMOOTHING: float = 0.2
+
+    def __init__(self, network: Network, batch_size: int = 100) -> None:
+        self.network: Network = network
+        self.batch_size: int = batch_size
+        self.interval: float = network.block_time
+
+        self._w3: AsyncWeb3 | None = None
+        self._pending: Dict[HexBytes, asyncio.Future] = {}
+        self._waiters: Dict[HexBytes, int] = {}
+        self._task: asyncio.Task | None = None
+        self._new_block: asyncio.Event | None = None
+        self._last_block: int | None = None
+        self._last_block_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def wait(self, w3: AsyncWeb3, tx_hash: HexBytes | str, timeout: float = 600) -> TxReceipt:
+        tx_hash = HexBytes(tx_hash)
+        self._w3 = w3
+
+        future: asyncio.Future | None = self._pending.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[tx_hash] = future
+        self._waiters[tx_hash] = self._waiters.get(tx_hash, 0) + 1
+
+        if self._task is None or self._task.done():
+            self._new_block = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(f"Transaction {tx_hash.to_0x_hex()} is not in the chain after {timeout} seconds")
+        finally:
+            waiters: int = self._waiters.get(tx_hash, 1) - 1
+            if waiters:
+                self._waiters[tx_hash] = waiters
+            else:
+                # the last waiter is gone, the hash is not polled any more
+                self._waiters.pop(tx_hash, None)
+                if self._pending.get(tx_hash) is future:
+                    self._pending.pop(tx_hash)
+
+    def notify(self) -> None:
+        if self._new_block is not None:
+            self._new_block.set()
+
+    def _update_interval(self, block_number: int) -> bool:
+        now: float = time.monotonic()
+        if self._last_block is not None and block_number <= self._last_block:
+            return False
+
+        if self._last_block is not None:
+            block_time: float = (now - self._last_block_at) / (block_number - self._last_block)
+            self.interval += self.SMOOTHING * (block_time - self.interval)
+
+        self._last_block, self._last_block_at = block_number, now
+        return True
+
+    async def _poll(self, tx_hashes: List[HexBytes]) -> None:
+        responses: List[Dict[str, Any]] = await self._w3.provider.make_batch_request([
+            ("eth_getTransactionReceipt", [tx_hash.to_0x_hex()])
+            for tx_hash in tx_hashes
+        ])
+
+        for tx_hash, response in zip(tx_hashes, responses):
+            result: Dict[str, Any] | None = response.get("result")
+            if not result:
+                continue
+
+            future: asyncio.Future | None = self._pending.pop(tx_hash, None)
+            if future is not None and not future.done():
+                future.set_result(AttributeDict.recursive(receipt_formatter(result)))
+
+    async def _run(self) -> None:
+        while self._pending:
+            try:
+                state: ChainState = await chain_states.get(self.network).get(self._w3)
+
+                if self._update_interval(state.block_number):
+                    tx_hashes: List[HexBytes] = list(self._pending)
+                    for start in range(0, len(tx_hashes), self.batch_size):
+                        await self._poll(tx_hashes[start:start + self.batch_size])
+
+            except Exception as error:
+                log.warning(f"{self.network.name} | Receipt polling failed: {error}")
+
+            try:
+                await asyncio.wait_for(self._new_block.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._new_block.clear()
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._waiters.clear()
+
+
+class ReceiptWatcherRegistry:
+    """
+    Process-wide receipt watchers keyed by chain id
+    """
+    __slots__ = (
+        "_watchers",
+    )
+
+    def __init__(self) -> None:
+        self._watchers: Dict[int, ReceiptWatcher] = {}
+
+    def __len__(self) -> int:
+        return len(self._watchers)
+
+    def get(self, network: Network) -> ReceiptWatcher:
+        watcher: ReceiptWatcher | None = self._watchers.get(network.chain_id)
+        if watcher is None:
+            watcher = ReceiptWatcher(network)
+            self._watchers[network.chain_id] = watcher
+        return watcher
+
+    def clear(self) -> None:
+        for watcher in self._watchers.values():
+            watcher.close()
+        self._watchers.clear()
+
+
+receipt_watchers: ReceiptWatcherRegistry = ReceiptWatcherRegistry()
@@ -0,0 +1,256 @@
+import asyncio
+import random
+import time
+
+from aiohttp import ClientSession, ClientTimeout
+from better_proxy import Proxy
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, List
+
+from logger import log
+from utils.networks import Network
+from .sessions import rpc_session_pool
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """
+    Health and latency of one RPC endpoint
+
+    Attributes:
+        url: str - адрес RPC
+        latency: float | None - EWMA задержки ответа (секунды)
+        requests: int - количество запросов
+        failures: int - количество ошибок
+        consecutive_failures: int - ошибок подряд
+        block_number: int | None - последний блок по данным проверки
+        healthy: bool - доступен ли эндпоинт для выбора
+        last_error: str | None - последняя ошибка
+        hedged: int - запросов, продублированных на другой эндпоинт
+        first_accepted: int - транзакций, которые этот эндпоинт принял первым при рассылке
+        samples: Deque[float] - последние задержки ответа (для перцентилей)
+    """
+    url: str
+    latency: float | None = None
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    block_number: int | None = None
+    healthy: bool = True
+    last_error: str | None = None
+    hedged: int = 0
+    first_accepted: int = 0
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=200))
+
+    def percentile(self, percent: float) -> float | None:
+        if not self.samples:
+            return None
+        ordered: List[float] = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def __str__(self) -> str:
+        latency: str = f"{self.latency * 1000:.0f}ms" if self.latency is not None else "n/a"
+        return (
+            f"{self.url} | {'healthy' if self.healthy else 'unhealthy'} | Requests: {self.requests} | "
+            f"Failures: {self.failures} | Hedged: {self.hedged} | First accepted: {self.first_accepted} | "
+            f"Latency: {latency}"
+        )
+
+
+class RPCRouter:
+    """
+    Endpoint selection for one network.
+
+    Endpoints are scored by EWMA latency of real requests and background
+    eth_blockNumber probes; a wallet gets an endpoint picked with weights
+    inverse to its latency, and moves to another one when a request fails.
+    An endpoint is skipped after several failures in a row or when it lags
+    behind the others, until a probe finds it healthy again. Probes go through
+    the proxy of the first wallet with a proxy that uses the router, over the same
+    pooled session as its requests; without proxied wallets they are sent directly,
+    like the requests of those wallets.
+
+    With hedging enabled, a read that has not been answered within the given
+    latency percentile of its endpoint is sent to a second endpoint as well.
+    """
+    __slots__ = (
+        "network",
+        "endpoints",
+        "probe_interval",
+        "hedge_percentile",
+        "proxy",
+        "_task",
+    )
+    SMOOTHING: float = 0.3
+    MAX_FAILURES: int = 3
+    MAX_BLOCK_LAG: int = 5
+    PROBE_TIMEOUT: float = 10
+    MIN_HEDGE_SAMPLES: int = 20
+
+    def __init__(self,
+                 network: Network,
+                 probe_interval: float = 30,
+                 hedge_percentile: float | None = None,
+                 ) -> None:
+        self.network: Network = network
+        self.endpoints: Dict[str, EndpointStats] = {
+            str(url): EndpointStats(url=str(url))
+            for url in network.rpc
+        }
+        self.probe_interval: float = probe_interval
+        self.hedge_percentile: float | None = hedge_percentile
+        self.proxy: Proxy | None = None
+        self._task: asyncio.Task | None = None
+
+    def healthy_endpoints(self) -> List[str]:
+        healthy: List[str] = [url for url, stats in self.endpoints.items() if stats.healthy]
+        return healthy or list(self.endpoints)
+
+    def choose(self, exclude: Iterable[str] = ()) -> str:
+        excluded = set(exclude)
+        candidates: List[str] = [url for url in self.healthy_endpoints() if url not in excluded] \
+            or [url for url in self.endpoints if url not in excluded] \
+            or list(self.endpoints)
+
+        latencies: List[float] = [
+            self.endpoints[url].latency
+            for url in candidates
+            if self.endpoints[url].latency is not None
+        ]
+        default_latency: float = sum(latencies) / len(latencies) if latencies else 1
+        weights: List[float] = [
+            1 / max(self.endpoints[url].latency or default_latency, 0.001)
+            for url in candidates
+        ]
+        return random.choices(candidates, weights=weights)[0]
+
+    def hedge_delay(self, url: str) -> float | None:
+        stats: EndpointStats | None = self.endpoints.get(url)
+        if (
+            self.hedge_percentile is None
+            or stats is None
+            or len(stats.samples) < self.MIN_HEDGE_SAMPLES
+            or len(self.healthy_endpoints()) < 2
+        ):
+            return None
+        return stats.percentile(self.hedge_percentile)
+
+    def record_success(self, url: str, latency: float) -> None:
+        stats: EndpointStats | None = self.endpoints.get(url)
+        if stats is None:
+            return
+
+        stats.requests += 1
+        stats.consecutive_failures = 0
+        stats.samples.append(latency)
+        stats.latency = latency if stats.latency is None else stats.latency + self.SMOOTHING * (latency - stats.latency)
+
+    def record_failure(self, url: str, error: BaseException | str) -> None:
+        stats: EndpointStats | None = self.endpoints.get(url)
+        if stats is None:
+            return
+
+        stats.requests += 1
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        stats.last_error = str(error) or type(error).__name__
+
+        if stats.healthy and stats.consecutive_failures >= self.MAX_FAILURES:
+            stats.healthy = False
+            log.warning(f"{self.network.name} | RPC {url} marked unhealthy: {stats.last_error}")
+
+    async def _probe(self, session: ClientSession, url: str) -> None:
+        started_at: float = time.monotonic()
+        try:
+            async with session.post(
+                url,
+                json={"jsonrpc": "2.0", "id": 1, "method": "eth_blockNumber", "params": []},
+                timeout=ClientTimeout(total=self.PROBE_TIMEOUT),
+                proxy=self.proxy.as_url if self.proxy else None,
+            ) as response:
+                response.raise_for_status()
+                self.endpoints[url].block_number = int((await response.json(content_type=None))["result"], 16)
+            self.record_success(url, time.monotonic() - started_at)
+        except Exception as error:
+            self.record_failure(url, error)
+
+    async def probe(self) -> None:
+        await asyncio.gather(*[
+            self._probe(await rpc_session_pool.get(url, self.proxy), url)
+            for url in self.endpoints
+        ])
+
+        head: int = max((stats.block_number or 0 for stats in self.endpoints.values()), default=0)
+        for stats in self.endpoints.values():
+            healthy: bool = (
+                stats.consecutive_failures == 0
+                and stats.block_number is not None
+                and head - stats.block_number <= self.MAX_BLOCK_LAG
+            )
+            if healthy != stats.healthy:
+                log.info(f"{self.network.name} | RPC {stats.url} is now {'healthy' if healthy else 'unhealthy'}")
+            stats.healthy = healthy
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.probe()
+            except Exception as error:
+                log.warning(f"{self.network.name} | RPC health probe failed: {error}")
+            await asyncio.sleep(self.probe_interval)
+
+    def start(self, proxy: Proxy | None = None) -> None:
+        if self.proxy is None:
+            self.proxy = proxy
+        if len(self.endpoints) > 1 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+class RPCRouterRegistry:
+    """
+    Process-wide RPC routers keyed by chain id
+    """
+    __slots__ = (
+        "hedge_percentile",
+        "_routers",
+    )
+
+    def __init__(self) -> None:
+        self.hedge_percentile: float | None = None
+        self._routers: Dict[int, RPCRouter] = {}
+
+    def __len__(self) -> int:
+        return len(self._routers)
+
+    def get(self, network: Network) -> RPCRouter:
+        router: RPCRouter | None = self._routers.get(network.chain_id)
+        if router is None:
+            router = RPCRouter(network, hedge_percentile=self.hedge_percentile)
+            self._routers[network.chain_id] = router
+        return router
+
+    def configure(self, hedge_percentile: float | None = None) -> None:
+        self.hedge_percentile = hedge_percentile
+        for router in self._routers.values():
+            router.hedge_percentile = hedge_percentile
+
+    def stats(self) -> Dict[str, List[EndpointStats]]:
+        return {
+            router.network.name: list(router.endpoints.values())
+            for router in self._routers.values()
+        }
+
+    def clear(self) -> None:
+        for router in self._routers.values():
+            router.close()
+        self._routers.clear()
+        self.hedge_percentile = None
+
+
+rpc_routers: RPCRouterRegistry = RPCRouterRegistry()
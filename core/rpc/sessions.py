@@ -0,0 +1,81 @@
+import asyncio
+
+from aiohttp import ClientSession, TCPConnector
+from better_proxy import Proxy
+from typing import Dict, Tuple, TypeAlias
+
+from logger import log
+
+SessionKey: TypeAlias = Tuple[str, str | None]
+
+
+class RPCSessionPool:
+    """
+    Process-wide pool of keep-alive aiohttp sessions keyed by (rpc_url, proxy).
+
+    Wallets borrow sessions from the pool instead of owning them, so accounts
+    that share an RPC and a proxy reuse the same TCP/TLS connections.
+    """
+    __slots__ = (
+        "limit_per_host",
+        "_sessions",
+        "_lock",
+    )
+
+    def __init__(self, limit_per_host: int = 100) -> None:
+        self.limit_per_host: int = limit_per_host
+        self._sessions: Dict[SessionKey, ClientSession] = {}
+        self._lock: asyncio.Lock | None = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @staticmethod
+    def make_key(rpc_url: str, proxy: Proxy | str | None = None) -> SessionKey:
+        if isinstance(proxy, Proxy):
+            proxy = proxy.as_url
+        return str(rpc_url), proxy or None
+
+    def _create_session(self) -> ClientSession:
+        return ClientSession(
+            connector=TCPConnector(
+                limit=0,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+                ssl=False,
+            ),
+        )
+
+    async def get(self, rpc_url: str, proxy: Proxy | str | None = None) -> ClientSession:
+        key: SessionKey = self.make_key(rpc_url, proxy)
+
+        session: ClientSession | None = self._sessions.get(key)
+        if session is not None and not session.closed and not session._loop.is_closed():
+            return session
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            session = self._sessions.get(key)
+            if session is None or session.closed or session._loop.is_closed():
+                session = self._create_session()
+                self._sessions[key] = session
+
+        return session
+
+    async def close(self) -> None:
+        sessions, self._sessions = list(self._sessions.values()), {}
+        self._lock = None
+
+        for session in sessions:
+            try:
+                if not session.closed and not session._loop.is_closed():
+                    await session.close()
+            except Exception as error:
+                log.error(f"Failed to close RPC session: {error}")
+
+
+rpc_session_pool: RPCSessionPool = RPCSessionPool()
@@ -0,0 +1,139 @@
+import asyncio
+import json
+
+from typing import Any, Awaitable, Callable, Dict, Literal, Tuple, TypeAlias
+from web3.types import RPCEndpoint, RPCResponse
+
+Cacheability = Literal[
+    "immutable",
+    "block",
+    "account",
+    "none",
+]
+RequestKey: TypeAlias = Tuple[str, str, str]
+
+IMMUTABLE_METHODS = {
+    "eth_chainId",
+    "net_version",
+}
+BLOCK_METHODS = {
+    "eth_blockNumber",
+    "eth_gasPrice",
+    "eth_maxPriorityFeePerGas",
+    "eth_feeHistory",
+    "eth_getBlockByNumber",
+    "eth_call",
+    "eth_getTransactionReceipt",
+}
+ACCOUNT_METHODS = {
+    "eth_getBalance",
+    "eth_getTransactionCount",
+    "eth_estimateGas",
+}
+# name(), symbol(), decimals() of tokens never change
+IMMUTABLE_SELECTORS = {
+    "0x06fdde03",
+    "0x95d89b41",
+    "0x313ce567",
+}
+
+
+def is_read(method: RPCEndpoint | str) -> bool:
+    return method in IMMUTABLE_METHODS or method in BLOCK_METHODS or method in ACCOUNT_METHODS
+
+
+def get_cacheability(method: RPCEndpoint | str, params: Any) -> Cacheability:
+    if method in IMMUTABLE_METHODS:
+        return "immutable"
+
+    if method == "eth_call" and params and isinstance(params[0], dict):
+        data: str = str(params[0].get("data") or params[0].get("input") or "")
+        if data[:10].lower() in IMMUTABLE_SELECTORS:
+            return "immutable"
+
+    if method in BLOCK_METHODS:
+        return "block"
+    if method in ACCOUNT_METHODS:
+        return "account"
+    return "none"
+
+
+class RequestCoalescer:
+    """
+    Process-wide singleflight for RPC reads.
+
+    While a read for (endpoint, method, params) is in flight, identical reads
+    wait for its response instead of sending their own request. Every method is
+    tagged with its cacheability: immutable responses (chain id, token name,
+    symbol, decimals) are kept for the whole run; per block and per account reads
+    are only shared while in flight, since block and fee data already come from
+    the chain state cache and account reads change with the account's own
+    transactions. Writes are never coalesced.
+    """
+    __slots__ = (
+        "_in_flight",
+        "_immutable",
+    )
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[RequestKey, asyncio.Future] = {}
+        self._immutable: Dict[RequestKey, RPCResponse] = {}
+
+    def __len__(self) -> int:
+        return len(self._immutable)
+
+    @staticmethod
+    def make_key(endpoint: str, method: RPCEndpoint | str, params: Any) -> RequestKey:
+        return str(endpoint), str(method), json.dumps(params, sort_keys=True, default=str)
+
+    async def request(self,
+                      endpoint: str,
+                      method: RPCEndpoint,
+                      params: Any,
+                      fetch: Callable[[], Awaitable[RPCResponse]],
+                      ) -> RPCResponse:
+        cacheability: Cacheability = get_cacheability(method, params)
+        if cacheability == "none":
+            return await fetch()
+
+        key: RequestKey = self.make_key(endpoint, method, params)
+        if key in self._immutable:
+            return self._immutable[key]
+
+        future: asyncio.Future | None = self._in_flight.get(key)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # the leader was cancelled, not this caller
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await fetch()
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._in_flight[key] = future
+
+        try:
+            response: RPCResponse = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        future.set_result(response)
+        if cacheability == "immutable" and "error" not in response:
+            self._immutable[key] = response
+
+        return response
+
+    def clear(self) -> None:
+        self._in_flight.clear()
+        self._immutable.clear()
+
+
+request_coalescer: RequestCoalescer = RequestCoalescer()
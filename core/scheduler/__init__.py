@@ -0,0 +1,5 @@
+from .delay import DelayScheduler
+from .lanes import Lane
+from .lanes import LaneScheduler
+from .pool import PoolStats
+from .pool import WorkerPool
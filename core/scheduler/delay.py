@@ -0,0 +1,67 @@
+import asyncio
+import heapq
+import itertools
+
+from typing import Any, AsyncIterator, List, Tuple
+
+
+class DelayScheduler:
+    """
+    Min-heap of items ordered by due time.
+
+    Every item gets its start time when it is pushed; iterating the scheduler
+    yields items only once they are due, so start delays are paid while the
+    item waits in the heap instead of inside a worker slot.
+    """
+    __slots__ = (
+        "_heap",
+        "_counter",
+        "_closed",
+        "_wakeup",
+    )
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter: itertools.count = itertools.count()
+        self._closed: bool = False
+        self._wakeup: asyncio.Event = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def push(self, item: Any, delay: float = 0) -> None:
+        if self._closed:
+            raise RuntimeError("Can't push into a closed scheduler")
+
+        due: float = asyncio.get_running_loop().time() + max(delay, 0)
+        heapq.heappush(self._heap, (due, next(self._counter), item))
+        self._wakeup.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            timeout: float | None = None
+
+            if self._heap:
+                timeout = self._heap[0][0] - loop.time()
+                if timeout <= 0:
+                    yield heapq.heappop(self._heap)[2]
+                    continue
+
+            elif self._closed:
+                return
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
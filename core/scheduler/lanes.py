@@ -0,0 +1,128 @@
+import asyncio
+import asyncio_throttle
+
+from typing import Any, Awaitable, Callable, Dict
+
+from models import LaneConfig
+from .delay import DelayScheduler
+from .pool import PoolStats, WorkerPool
+
+
+class Lane:
+    """
+    Scheduling lane of a single network: own timer heap, worker pool and start rate
+    """
+    __slots__ = (
+        "name",
+        "scheduler",
+        "pool",
+        "throttler",
+    )
+
+    def __init__(self,
+                 name: str,
+                 handler: Callable[[Any], Awaitable[Any]],
+                 threads: int,
+                 rate_limit: int | None = None,
+                 period: float = 1,
+                 ) -> None:
+        self.name: str = name
+        self.scheduler: DelayScheduler = DelayScheduler()
+        self.throttler: asyncio_throttle.Throttler | None = (
+            asyncio_throttle.Throttler(rate_limit=rate_limit, period=period)
+            if rate_limit else None
+        )
+        # module starts are throttled before a worker is taken
+        self.pool: WorkerPool = WorkerPool(
+            handler=handler,
+            workers=threads,
+            name=f"Lane {name}",
+            throttler=self.throttler,
+        )
+
+    async def run(self) -> PoolStats:
+        return await self.pool.run(self.scheduler)
+
+
+class LaneScheduler:
+    """
+    Set of independent lanes keyed by network.
+
+    Each lane has its own concurrency cap and start rate, so a slow lane
+    never holds workers of the others. Items may be re-submitted to another
+    lane from the handler; the scheduler drains once it is closed and no
+    submitted item is left unfinished.
+    """
+    __slots__ = (
+        "lanes",
+        "lanes_config",
+        "default_threads",
+        "_handler",
+        "_pending",
+        "_closed",
+        "_task_group",
+    )
+
+    def __init__(self,
+                 handler: Callable[[Any], Awaitable[Any]],
+                 default_threads: int,
+                 lanes_config: Dict[str, LaneConfig] | None = None,
+                 ) -> None:
+        self.lanes: Dict[str, Lane] = {}
+        self.lanes_config: Dict[str, LaneConfig] = lanes_config or {}
+        self.default_threads: int = default_threads
+
+        self._handler: Callable[[Any], Awaitable[Any]] = handler
+        self._pending: int = 0
+        self._closed: bool = False
+        self._task_group: asyncio.TaskGroup | None = None
+
+    def _get_lane(self, name: str) -> Lane:
+        lane: Lane | None = self.lanes.get(name)
+        if lane is None:
+            settings: LaneConfig | None = self.lanes_config.get(name)
+            lane = Lane(
+                name=name,
+                handler=self._handle,
+                threads=settings.threads if settings else self.default_threads,
+                rate_limit=settings.rate_limit if settings else None,
+                period=settings.period if settings else 1,
+            )
+            self.lanes[name] = lane
+
+            if self._task_group:
+                self._task_group.create_task(lane.run())
+
+        return lane
+
+    async def _handle(self, item: Any) -> Any:
+        try:
+            return await self._handler(item)
+        finally:
+            self._pending -= 1
+            self._drain_if_done()
+
+    def _drain_if_done(self) -> None:
+        if self._closed and self._pending == 0:
+            for lane in self.lanes.values():
+                lane.scheduler.close()
+
+    def submit(self, item: Any, lane: str, delay: float = 0) -> None:
+        self._get_lane(lane).scheduler.push(item, delay)
+        self._pending += 1
+
+    def close(self) -> None:
+        self._closed = True
+        self._drain_if_done()
+
+    async def run(self) -> Dict[str, PoolStats]:
+        async with asyncio.TaskGroup() as tg:
+            self._task_group = tg
+            for lane in list(self.lanes.values()):
+                tg.create_task(lane.run())
+
+        self._task_group = None
+        return {
+            name: lane.pool.stats
+            for name, lane in self.lanes.items()
+        }
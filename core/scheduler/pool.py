@@ -0,0 +1,179 @@
+import asyncio
+import asyncio_throttle
+import time
+
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Sized
+
+from logger import log
+
+
+@dataclass(slots=True)
+class PoolStats:
+    """
+    Runtime counters of a worker pool
+
+    Attributes:
+        workers: int - количество воркеров в пуле
+        submitted: int - сколько элементов поставлено в очередь
+        completed: int - сколько элементов обработано
+        succeeded: int - сколько элементов обработано успешно
+        failed: int - сколько элементов завершилось ошибкой
+        peak_queue_depth: int - максимальное число ожидающих элементов (источник + очередь передачи)
+        busy_time: float - суммарное время работы воркеров (секунды)
+        elapsed: float - время жизни пула (секунды)
+    """
+    workers: int
+    submitted: int = 0
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    peak_queue_depth: int = 0
+    busy_time: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def utilisation(self) -> float:
+        if not self.elapsed or not self.workers:
+            return 0.0
+        return min(self.busy_time / (self.workers * self.elapsed), 1.0)
+
+
+class WorkerPool:
+    """
+    Fixed-size pool of coroutines pulling items from a bounded queue.
+
+    The number of live coroutines never exceeds `workers` (plus the feeder and
+    the reporter), no matter how many items are pushed through the pool. With a
+    throttler the feeder waits for it before handing an item over, so the start
+    rate is limited without holding a worker.
+    """
+    __slots__ = (
+        "name",
+        "workers",
+        "handler",
+        "report_interval",
+        "throttler",
+        "stats",
+        "_queue",
+        "_source",
+        "_busy",
+        "_started_at",
+    )
+    _STOP: object = object()
+
+    def __init__(self,
+                 handler: Callable[[Any], Awaitable[Any]],
+                 workers: int,
+                 name: str = "Pool",
+                 queue_size: int | None = None,
+                 report_interval: float = 30,
+                 throttler: asyncio_throttle.Throttler | None = None,
+                 ) -> None:
+        self.name: str = name
+        self.workers: int = max(1, int(workers))
+        self.handler: Callable[[Any], Awaitable[Any]] = handler
+        self.report_interval: float = report_interval
+        self.throttler: asyncio_throttle.Throttler | None = throttler
+        self.stats: PoolStats = PoolStats(workers=self.workers)
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or self.workers * 2)
+        self._source: Iterable | AsyncIterable | None = None
+        self._busy: int = 0
+        self._started_at: float = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Items waiting for a worker: the backlog of a sized source (e.g. the
+        timer heap of a lane) plus the bounded hand-off queue
+        """
+        backlog: int = len(self._source) if isinstance(self._source, Sized) else 0
+        return backlog + self._queue.qsize()
+
+    @property
+    def busy_workers(self) -> int:
+        return self._busy
+
+    @staticmethod
+    def _is_success(result: Any) -> bool:
+        if isinstance(result, tuple) and result:
+            return bool(result[0])
+        return bool(result)
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is self._STOP:
+                    return
+
+                self._busy += 1
+                started_at: float = time.perf_counter()
+                try:
+                    result = await self.handler(item)
+                    if self._is_success(result):
+                        self.stats.succeeded += 1
+                    else:
+                        self.stats.failed += 1
+                except Exception as error:
+                    self.stats.failed += 1
+                    log.error(f"{self.name} | Unhandled error in worker: {error}")
+                finally:
+                    self._busy -= 1
+                    self.stats.completed += 1
+                    self.stats.busy_time += time.perf_counter() - started_at
+            finally:
+                self._queue.task_done()
+
+    async def submit(self, item: Any) -> None:
+        if self.throttler:
+            async with self.throttler:
+                pass
+        await self._queue.put(item)
+        self.stats.submitted += 1
+        self.stats.peak_queue_depth = max(self.stats.peak_queue_depth, self.queue_depth)
+
+    async def _feed(self, items: Iterable | AsyncIterable) -> None:
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                await self.submit(item)
+        else:
+            for item in items:
+                await self.submit(item)
+
+        for _ in range(self.workers):
+            await self._queue.put(self._STOP)
+
+    def report(self) -> None:
+        self.stats.elapsed = time.perf_counter() - self._started_at
+        log.info(
+            f"{self.name} | Queue depth: {self.queue_depth} | "
+            f"Busy workers: {self.busy_workers}/{self.workers} | "
+            f"Done: {self.stats.completed}/{self.stats.submitted} | "
+            f"Utilisation: {self.stats.utilisation:.0%}"
+        )
+
+    async def _reporter(self) -> None:
+        while True:
+            await asyncio.sleep(self.report_interval)
+            self.report()
+
+    async def run(self, items: Iterable | AsyncIterable) -> PoolStats:
+        self._started_at = time.perf_counter()
+        self._source = items
+        reporter: asyncio.Task | None = (
+            asyncio.create_task(self._reporter()) if self.report_interval > 0 else None
+        )
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(self.workers):
+                    tg.create_task(self._worker())
+                tg.create_task(self._feed(items))
+        finally:
+            if reporter:
+                reporter.cancel()
+            self.stats.elapsed = time.perf_counter() - self._started_at
+
+        return self.stats
@@ -0,0 +1,94 @@
+import asyncio
+import multiprocessing
+import os
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, TypeVar
+
+from eth_account import Account
+from eth_account.datastructures import SignedMessage, SignedTransaction
+from eth_account.messages import SignableMessage
+from eth_keys.backends import NativeECCBackend, get_backend
+
+from logger import log
+
+T = TypeVar("T")
+
+
+def _sign_transaction(private_key: bytes, transaction: Dict[str, Any]) -> SignedTransaction:
+    return Account.sign_transaction(transaction, private_key)
+
+
+def _sign_message(private_key: bytes, message: SignableMessage) -> SignedMessage:
+    return Account.sign_message(message, private_key)
+
+
+class SigningExecutor:
+    """
+    Process-wide executor for CPU-bound signing and ABI encoding.
+
+    With the coincurve backend of eth-keys secp256k1 releases the GIL, so
+    signatures are made on the thread pool; with the pure Python backend they
+    would hold the GIL and are sent to a process pool instead. ABI encoding
+    needs the wallet's web3 codec and always runs on the thread pool.
+    """
+    __slots__ = (
+        "max_workers",
+        "_threads",
+        "_processes",
+    )
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+
+    @staticmethod
+    def releases_gil() -> bool:
+        return not isinstance(get_backend(), NativeECCBackend)
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="signing")
+        return self._threads
+
+    def _signing_pool(self) -> Executor:
+        if self.releases_gil():
+            return self._thread_pool()
+
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._processes
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._thread_pool(), partial(func, *args, **kwargs))
+
+    async def _sign(self, func: Callable[..., T], *args: Any) -> T:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._signing_pool(), func, *args)
+        except BrokenProcessPool as error:
+            log.warning(f"Signing process pool is broken, signing on threads: {error}")
+            self._processes = None
+            return await loop.run_in_executor(self._thread_pool(), func, *args)
+
+    async def sign_transaction(self, private_key: bytes, transaction: Dict[str, Any]) -> SignedTransaction:
+        return await self._sign(_sign_transaction, bytes(private_key), dict(transaction))
+
+    async def sign_message(self, private_key: bytes, message: SignableMessage) -> SignedMessage:
+        return await self._sign(_sign_message, bytes(private_key), message)
+
+    def close(self) -> None:
+        for executor in (self._threads, self._processes):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._threads = None
+        self._processes = None
+
+
+signing_executor: SigningExecutor = SigningExecutor()
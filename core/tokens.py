@@ -0,0 +1,162 @@
+import asyncio
+import sqlite3
+import time
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Tuple, TypeAlias
+
+from eth_typing import ChecksumAddress
+from eth_utils import to_checksum_address
+
+from logger import log
+
+TokenKey: TypeAlias = Tuple[int, str]
+
+
+@dataclass(frozen=True, slots=True)
+class TokenInfo:
+    """
+    Token metadata
+
+    Attributes:
+        chain_id: int - id сети
+        address: ChecksumAddress - checksum адрес токена
+        symbol: str - тикер токена
+        decimals: int - количество знаков после запятой
+    """
+    chain_id: int
+    address: ChecksumAddress
+    symbol: str
+    decimals: int
+
+
+# Only tokens with verified addresses are bundled, the other Ink tokens
+# (USDC, USDT, KRAKEN, WORM, ISWAP, SINK) are read on first use and saved
+KNOWN_TOKENS: Tuple[TokenInfo, ...] = (
+    TokenInfo(57073, to_checksum_address("0x4200000000000000000000000000000000000006"), "WETH", 18),
+)
+
+
+class TokenRegistry:
+    """
+    Process-wide token metadata keyed by (chain_id, address).
+
+    Preloaded with the bundled tokens and the ones discovered by earlier runs
+    (sqlite, WAL mode). A token that is not known yet is read from the chain
+    once, by the first wallet that needs it, and saved; the other wallets wait
+    for that read instead of calling decimals() themselves.
+    """
+    __slots__ = (
+        "path",
+        "_connection",
+        "_tokens",
+        "_locks",
+    )
+
+    def __init__(self, path: str | Path = Path("./config/data/tokens.sqlite3")) -> None:
+        self.path: Path = Path(path)
+        self._connection: sqlite3.Connection | None = None
+        self._tokens: Dict[TokenKey, TokenInfo] = {}
+        self._locks: Dict[TokenKey, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        self._connect()
+        return len(self._tokens)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.path,
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tokens (
+                    chain_id INTEGER NOT NULL,
+                    address TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    decimals INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (chain_id, address)
+                ) WITHOUT ROWID
+                """
+            )
+
+            self._tokens = {
+                self.make_key(token.chain_id, token.address): token
+                for token in KNOWN_TOKENS
+            }
+            for chain_id, address, symbol, decimals in self._connection.execute(
+                "SELECT chain_id, address, symbol, decimals FROM tokens"
+            ):
+                self._tokens.setdefault(
+                    self.make_key(chain_id, address),
+                    TokenInfo(chain_id, to_checksum_address(address), symbol, decimals),
+                )
+
+        return self._connection
+
+    @staticmethod
+    def make_key(chain_id: int, address: str) -> TokenKey:
+        return chain_id, address.lower()
+
+    def get(self, chain_id: int, address: str) -> TokenInfo | None:
+        self._connect()
+        return self._tokens.get(self.make_key(chain_id, address))
+
+    def add(self, token: TokenInfo) -> None:
+        connection: sqlite3.Connection = self._connect()
+        self._tokens[self.make_key(token.chain_id, token.address)] = token
+        try:
+            connection.execute(
+                """
+                INSERT INTO tokens (chain_id, address, symbol, decimals, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (chain_id, address) DO UPDATE SET
+                    symbol = excluded.symbol,
+                    decimals = excluded.decimals,
+                    updated_at = excluded.updated_at
+                """,
+                (token.chain_id, token.address.lower(), token.symbol, token.decimals, time.time()),
+            )
+        except sqlite3.Error as error:
+            log.error(f"Failed to save token {token.symbol} {token.address}: {error}")
+
+    async def resolve(self,
+                      chain_id: int,
+                      address: str,
+                      fetch: Callable[[], Awaitable[Tuple[int, str]]],
+                      ) -> TokenInfo:
+        """
+        Returns the known token or reads (decimals, symbol) with fetch and saves it
+        """
+        key: TokenKey = self.make_key(chain_id, address)
+        token: TokenInfo | None = self.get(chain_id, address)
+        if token is not None:
+            return token
+
+        lock: asyncio.Lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            token = self._tokens.get(key)
+            if token is None:
+                decimals, symbol = await fetch()
+                token = TokenInfo(chain_id, to_checksum_address(address), symbol, decimals)
+                self.add(token)
+
+        self._locks.pop(key, None)
+        return token
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._locks.clear()
+
+
+token_registry: TokenRegistry = TokenRegistry()
@@ -1,34 +1,71 @@
 import asyncio
-import asyncio_throttle
 
 from better_proxy import Proxy
 from decimal import Decimal
 from eth_account import Account
 from eth_account.messages import encode_defunct
+from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress, HexStr
 from pydantic import HttpUrl
-from typing import Any, Dict, Self
-from web3 import AsyncWeb3, AsyncHTTPProvider
+from typing import Any, Dict, List, Self, Tuple
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3._utils.contracts import prepare_transaction
 from web3.contract import AsyncContract
+from web3.contract.async_contract import AsyncContractFunction
 from web3.eth import AsyncEth
-from web3.types import Nonce, TxParams
+from web3.exceptions import TimeExhausted
+from web3.types import Nonce, TxParams, TxReceipt
+from web3.utils.abi import abi_to_signature
 
+from core.allowances import allowances
+from core.contracts import BoundContract, contracts
 from core.exceptions import WalletError, BlockchainError, InsufficientFundsError
+from core.gas import gas_profiles
+from core.journal import record_tx_hash
+from core.rpc import (
+    ChainState,
+    chain_states,
+    nonce_manager,
+    receipt_watchers,
+    rpc_routers,
+    RPCRouter,
+    SharedHTTPProvider,
+)
+from core.signing import signing_executor
+from core.tokens import TokenInfo, token_registry
 from logger import log
 from models import BaseContract, ERC20Contract
+from utils.networks import Network
+
+# broadcast errors after which the local nonce no longer matches the chain
+NONCE_RESYNC_ERRORS: Tuple[str, ...] = (
+    "nonce too low",
+    "nonce_too_small",
+    "nonce too high",
+    "replacement transaction underpriced",
+)
 
 
 class Wallet(AsyncWeb3, Account):
     ZERO_ADDRESS: str = "0x0000000000000000000000000000000000000000"
 
     def __init__(self,
-                 private_key: str,
+                 private_key: str | LocalAccount,
                  proxy: Proxy | None = None,
                  rpc_url: HttpUrl | str = None,
+                 network: Network | None = None,
                  ) -> None:
 
-        provider: AsyncHTTPProvider = AsyncHTTPProvider(
+        router: RPCRouter | None = rpc_routers.get(network) if network else None
+        if rpc_url is None and router:
+            rpc_url = router.choose()
+
+        provider: SharedHTTPProvider = SharedHTTPProvider(
             endpoint_uri=str(rpc_url),
+            proxy=proxy,
+            chain_id=network.chain_id if network else None,
+            router=router,
             request_kwargs={
                 "proxy": proxy.as_url if proxy else None,
                 "ssl": False,
@@ -36,26 +73,27 @@ class Wallet(AsyncWeb3, Account):
         )
         super().__init__(provider=provider, modules={"eth": AsyncEth})
 
-        self.private_key: str = self._initialize_private_key(private_key)
-        self._contracts_cache: Dict[str, AsyncContract] = {}
-        self._throttler: asyncio_throttle.Throttler = asyncio_throttle.Throttler(rate_limit=10, period=1)
+        self.proxy: Proxy | None = proxy
+        self.network: Network | None = network
+        self._chain_id: int | None = network.chain_id if network else None
+        self.private_key: LocalAccount = self._initialize_private_key(private_key)
+        self._contracts_cache: Dict[str, BoundContract | AsyncContract] = {}
 
     async def __aenter__(self: Self) -> Self:
+        await self.provider.use_endpoint(self.rpc_url)
+        if self.provider.router:
+            self.provider.router.start(self.proxy)
         return self
 
     async def __aexit__(self, exc_type, exc_value, exc_traceback):
-        if hasattr(self.provider, '_session') and self.provider._session is not None:
-            try:
-                await self.provider._session.close()
-            except Exception as error:
-                log.error(f"Failed to close session: {error}", exc_info=True)
-
-    async def _close_session(self):
-        if hasattr(self.provider, '_session') and self.provider._session:
-            await self.provider._session.close()
+        # the RPC session is borrowed from the shared pool and closed with it
+        pass
 
     @staticmethod
-    def _initialize_private_key(private_key: str) -> Account:
+    def _initialize_private_key(private_key: str | LocalAccount) -> LocalAccount:
+        if isinstance(private_key, LocalAccount):
+            return private_key
+
         try:
             stripped_key = private_key.strip().lower()
             if not stripped_key.startswith("0x"):
@@ -68,12 +106,19 @@ class Wallet(AsyncWeb3, Account):
             log.error(f"Failed to initialize private key: {error}", exc_info=True)
             raise WalletError(f"Invalid private key format: {error}") from error
 
+    @property
+    def rpc_url(self) -> str:
+        return str(self.provider.endpoint_uri)
+
     @property
     def wallet_address(self) -> ChecksumAddress:
         return self.private_key.address
 
     @property
     async def use_eip1559(self) -> bool:
+        if self.network:
+            return self.network.eip1559_support
+
         try:
             latest_block = await self.eth.get_block('latest')
             return 'baseFeePerGas' in latest_block
@@ -81,32 +126,45 @@ class Wallet(AsyncWeb3, Account):
             log.error(f"Error checking EIP-1559 support: {e}")
             return False
     
+    async def get_chain_id(self) -> int:
+        if self._chain_id is None:
+            self._chain_id = await self.eth.chain_id
+        return self._chain_id
+
+    async def get_chain_state(self) -> ChainState | None:
+        if not self.network:
+            return None
+        return await chain_states.get(self.network).get(self)
+
     @staticmethod
     def _get_checksum_address(address: str) -> ChecksumAddress:
         return AsyncWeb3.to_checksum_address(address)   
 
-    async def get_contract(self, contract: BaseContract | str | object) -> AsyncContract:
+    async def get_contract(self, contract: BaseContract | str | object) -> BoundContract | AsyncContract:
         if isinstance(contract, str):
             address: ChecksumAddress = self._get_checksum_address(contract)
 
             if address not in self._contracts_cache:
-                temp_contract: ERC20Contract = ERC20Contract(address="")
-                abi = await temp_contract.get_abi()
-                contract_instance: AsyncContract = self.eth.contract(
-                    address=address,
-                    abi=abi,
+                temp_contract: ERC20Contract = ERC20Contract()
+                self._contracts_cache[address] = contracts.bind(
+                    self,
+                    await self.get_chain_id(),
+                    address,
+                    temp_contract.abi_file,
+                    await temp_contract.get_abi(),
                 )
-                self._contracts_cache[address] = contract_instance
 
             return self._contracts_cache[address]
         
         if isinstance(contract, BaseContract):
             address: ChecksumAddress = self._get_checksum_address(contract.address)
             if address not in self._contracts_cache:
-                abi = await contract.get_abi()
-                self._contracts_cache[address] = self.eth.contract(
-                    address=address,
-                    abi=abi,
+                self._contracts_cache[address] = contracts.bind(
+                    self,
+                    await self.get_chain_id(),
+                    address,
+                    contract.abi_file,
+                    await contract.get_abi(),
                 )
             return self._contracts_cache[address]
 
@@ -123,7 +181,7 @@ class Wallet(AsyncWeb3, Account):
         raise TypeError("Invalid contract type: expected BaseContract, str, or contract-like object")
 
     async def token_balance(self, token_address: str) -> int:
-        contract: AsyncContract = await self.get_contract(token_address)
+        contract: BoundContract = await self.get_contract(token_address)
         return await contract.functions.balanceOf(
             self._get_checksum_address(self.private_key.address)
         ).call()
@@ -131,22 +189,47 @@ class Wallet(AsyncWeb3, Account):
     async def _is_native_token(self, token_address: str) -> bool:
         return token_address == self.ZERO_ADDRESS
 
-    async def _get_cached_contract(self, token_address: str) -> AsyncContract:
+    async def _get_cached_contract(self, token_address: str) -> BoundContract:
         checksum_address: ChecksumAddress = self._get_checksum_address(token_address)
         if checksum_address not in self._contracts_cache:
             self._contracts_cache[checksum_address] = await self.get_contract(checksum_address)
 
         return self._contracts_cache[checksum_address]
 
+    async def _fetch_token_metadata(self, token_address: ChecksumAddress) -> Tuple[int, str]:
+        contract: BoundContract = await self._get_cached_contract(token_address)
+        try:
+            async with self.batch_requests() as batch:
+                batch.add(contract.functions.decimals())
+                batch.add(contract.functions.symbol())
+                decimals, symbol = await batch.async_execute()
+        except Exception as error:
+            # symbol() of some tokens is bytes32 or missing, decimals() is what matters
+            log.debug(f"Batched token metadata request for {token_address} failed, retrying sequentially: {error}")
+            decimals = await contract.functions.decimals().call()
+            try:
+                symbol = await contract.functions.symbol().call()
+            except Exception:
+                symbol = ""
+
+        return int(decimals), str(symbol)
+
+    async def get_token(self, token_address: str) -> TokenInfo:
+        checksum_address: ChecksumAddress = self._get_checksum_address(token_address)
+        return await token_registry.resolve(
+            await self.get_chain_id(),
+            checksum_address,
+            lambda: self._fetch_token_metadata(checksum_address),
+        )
+
     async def convert_amount_to_decimals(self, amount: Decimal, token_address: str) -> int:
         checksum_address: ChecksumAddress = self._get_checksum_address(token_address)
     
         if await self._is_native_token(checksum_address):
             return self.to_wei(Decimal(str(amount)), 'ether')
         
-        contract: AsyncContract = await self._get_cached_contract(checksum_address)
-        decimals = await contract.functions.decimals().call()
-        return int(Decimal(str(amount)) * Decimal(10 ** decimals))
+        token: TokenInfo = await self.get_token(checksum_address)
+        return int(Decimal(str(amount)) * Decimal(10 ** token.decimals))
     
     async def convert_amount_from_decimals(self, amount: int, token_address: str) -> float:
         checksum_address = self._get_checksum_address(token_address)
@@ -154,9 +237,8 @@ class Wallet(AsyncWeb3, Account):
         if await self._is_native_token(checksum_address):
             return float(self.from_wei(amount, 'ether'))
         
-        contract = await self._get_cached_contract(checksum_address)
-        decimals = await contract.functions.decimals().call()
-        return float(Decimal(amount) / Decimal(10 ** decimals))
+        token: TokenInfo = await self.get_token(checksum_address)
+        return float(Decimal(amount) / Decimal(10 ** token.decimals))
 
     async def get_nonce(self) -> Nonce:
         for attempt in range(3):
@@ -170,6 +252,13 @@ class Wallet(AsyncWeb3, Account):
                 else:
                     raise RuntimeError("Failed to get nonce after 3 attempts") from e
 
+    async def resync_nonce(self) -> None:
+        """
+        Resyncs the local nonce of the address with its pending transaction count,
+        a nonce of a dropped transaction is handed out again
+        """
+        nonce_manager.resync(await self.get_chain_id(), self.wallet_address, await self.get_nonce())
+
     async def check_balance(self) -> None:
         balance = await self.eth.get_balance(self.private_key.address)
         if balance <= 0:
@@ -216,32 +305,138 @@ class Wallet(AsyncWeb3, Account):
             )
 
             encoded = encode_defunct(text=text)
-            signature = signing_key.sign_message(encoded).signature
+            signature = (await signing_executor.sign_message(signing_key.key, encoded)).signature
             
             return HexStr(signature.hex())
 
         except Exception as error:
             raise ValueError(f"Signing failed: {str(error)}") from error
 
+    async def _read_transaction_state(self, tx_params: TxParams, gas_buffer: float = 1.2) -> Dict[str, Any] | None:
+        """
+        Reads balance and gas estimate in one JSON-RPC batch, plus the pending nonce
+        if the address is not seeded in the nonce manager yet. When the call has a
+        learned gas profile the estimate is replaced by an eth_call with the buffered
+        learned gas limit, so a call that reverts or runs out of that gas still fails
+        before it is sent; the profile is then dropped and the call estimated live.
+        Block and fee data come from the shared chain state of the network; wallets
+        without a network add latest block and priority fee to the same batch.
+        Returns None if the batch failed and the caller has to fall back to sequential calls.
+        """
+        gas_used: int | None = None
+        try:
+            chain_id: int = await self.get_chain_id()
+            chain_state: ChainState | None = await self.get_chain_state()
+            seeded: bool = nonce_manager.is_seeded(chain_id, self.wallet_address)
+            to, data = tx_params.get("to"), tx_params.get("data")
+            gas_used = gas_profiles.get(chain_id, to, data)
+            needs_code: bool = gas_profiles.needs_code(chain_id, to, data)
+
+            async with self.batch_requests() as batch:
+                batch.add(self.eth.get_balance(self.wallet_address))
+                if gas_used is None:
+                    batch.add(self.eth.estimate_gas(tx_params))
+                else:
+                    batch.add(self.eth.call({**tx_params, "gas": int(gas_used * gas_buffer)}))
+                if needs_code:
+                    batch.add(self.eth.get_code(to))
+                if chain_state is None:
+                    batch.add(self.eth.get_block("latest"))
+                    batch.add(self.eth.max_priority_fee)
+                if not seeded:
+                    batch.add(self.eth.get_transaction_count(self.wallet_address, "pending"))
+                results = iter(await batch.async_execute())
+
+        except Exception as error:
+            log.warning(f"Batched pre-transaction reads failed, falling back to sequential calls: {error}")
+            if gas_used is not None:
+                # the learned limit may be too low for this call, estimate it live
+                gas_profiles.forget(chain_id, to, data)
+            return None
+
+        balance: int = next(results)
+        # the eth_call pre-check only has to succeed, its result is not used
+        estimate_or_call: int | bytes = next(results)
+        state: Dict[str, Any] = {
+            "balance": balance,
+            "gas_estimate": gas_used if gas_used is not None else estimate_or_call,
+        }
+
+        if needs_code:
+            gas_profiles.set_code(chain_id, to, next(results))
+
+        if chain_state is None:
+            latest_block, priority_fee = next(results), next(results)
+            state.update({
+                "base_fee": latest_block.get("baseFeePerGas"),
+                "priority_fee": priority_fee,
+                "gas_price": None,
+            })
+        else:
+            state.update({
+                "base_fee": chain_state.base_fee,
+                "priority_fee": chain_state.priority_fee,
+                "gas_price": chain_state.gas_price,
+            })
+
+        if not seeded:
+            nonce_manager.seed(chain_id, self.wallet_address, next(results))
+
+        return state
+
+    def _prepare_contract_transaction(self, contract_function: AsyncContractFunction, tx_params: TxParams) -> TxParams:
+        """
+        Encodes the contract call into to/data without build_transaction(),
+        which would estimate gas and fetch fees with separate requests
+        """
+        return prepare_transaction(
+            contract_function.address,
+            self,
+            abi_element_identifier=abi_to_signature(contract_function.abi),
+            contract_abi=contract_function.contract_abi,
+            abi_callable=contract_function.abi,
+            transaction=contract_function._build_transaction(tx_params),
+            fn_args=contract_function.args or (),
+            fn_kwargs=contract_function.kwargs or {},
+        )
+
     async def _estimate_gas_params(
         self,
         tx_params: dict,
         gas_buffer: float = 1.2,
         gas_price_buffer: float = 1.15,
         balance: float | None = None,
+        gas_estimate: int | None = None,
+        base_fee: int | None = None,
+        priority_fee: int | None = None,
+        gas_price: int | None = None,
     ) -> dict:
         try:
             if not balance:
                 balance: float = await self.human_balance()
 
-            gas_estimate = await self.eth.estimate_gas(tx_params)
+            if gas_estimate is None:
+                gas_estimate = await self.eth.estimate_gas(tx_params)
             tx_params["gas"] = int(gas_estimate * gas_buffer)
 
-            if await self.use_eip1559:
-                latest_block = await self.eth.get_block('latest')
-                base_fee = latest_block['baseFeePerGas']
-                priority_fee = await self.eth.max_priority_fee
-
+            eip1559: bool = await self.use_eip1559
+            if eip1559 and (base_fee is None or priority_fee is None):
+                chain_state: ChainState | None = await self.get_chain_state()
+                if base_fee is None:
+                    base_fee = (
+                        chain_state.base_fee
+                        if chain_state
+                        else (await self.eth.get_block('latest'))['baseFeePerGas']
+                    )
+                if priority_fee is None:
+                    priority_fee = (
+                        chain_state.priority_fee
+                        if chain_state
+                        else await self.eth.max_priority_fee
+                    )
+
+            # a base fee alone does not make a type 2 transaction, legacy chains report it too
+            if eip1559 and base_fee is not None and priority_fee is not None:
                 max_fee: int = int(base_fee * 2  + priority_fee)
 
                 if balance and int(self.to_wei(balance, "ether")) == tx_params.get("value", 0):
@@ -267,7 +462,10 @@ class Wallet(AsyncWeb3, Account):
                         "maxFeePerGas": int((base_fee * 2 + priority_fee) * gas_price_buffer)
                     })
             else:
-                tx_params["gasPrice"] = int(await self.eth.gas_price * gas_price_buffer)
+                if gas_price is None:
+                    chain_state: ChainState | None = await self.get_chain_state()
+                    gas_price = chain_state.gas_price if chain_state else await self.eth.gas_price
+                tx_params["gasPrice"] = int(gas_price * gas_price_buffer)
 
             return tx_params
         except Exception as error:
@@ -283,28 +481,47 @@ class Wallet(AsyncWeb3, Account):
         gas_price_buffer: float = 1.15,
         **kwargs
     ) -> Dict[str, Any]:
+        """
+        Builds transaction params with gas and fees. The nonce is left out unless passed
+        explicitly: it is allocated by the nonce manager when the transaction is sent,
+        so params that are built but never sent do not leave a nonce gap.
+        """
         base_params: Dict[str, Any] = {
             "from": self.wallet_address,
-            "nonce": await self.get_nonce(),
             "value": value,
             **kwargs,
         }
 
-        try:
-            chain_id = await self.eth.chain_id
-            base_params["chainId"] = chain_id
-        except Exception as e:
-            log.warning(f"Failed to get chain_id: {e}", exc_info=True)
+        if contract_function:
+            base_params = await signing_executor.run(self._prepare_contract_transaction, contract_function, base_params)
+            # the selector comes from the ABI, so gas of this call can be profiled
+            gas_profiles.add_call(await self.get_chain_id(), base_params.get("to"), base_params.get("data"))
+        elif to is None:
+            raise ValueError("'to' address required for ETH transfers")
+        else:
+            base_params.update({"to": to})
 
-        if not contract_function:
-            if to is None:
-                raise ValueError("'to' address required for ETH transfers")
+        state = await self._read_transaction_state(base_params, gas_buffer)
+        if state is None:
+            try:
+                base_params["chainId"] = await self.get_chain_id()
+            except Exception as e:
+                log.warning(f"Failed to get chain_id: {e}", exc_info=True)
 
-            base_params.update({"to": to})
             return await self._estimate_gas_params(base_params, gas_buffer, gas_price_buffer)
 
-        tx_params = await contract_function.build_transaction(base_params)
-        return await self._estimate_gas_params(tx_params, gas_buffer, gas_price_buffer)
+        base_params["chainId"] = await self.get_chain_id()
+
+        return await self._estimate_gas_params(
+            base_params,
+            gas_buffer,
+            gas_price_buffer,
+            balance=float(self.from_wei(state["balance"], "ether")),
+            gas_estimate=state["gas_estimate"],
+            base_fee=state["base_fee"],
+            priority_fee=state["priority_fee"],
+            gas_price=state["gas_price"],
+        )
 
     async def _check_and_approve_token(
         self, 
@@ -313,14 +530,19 @@ class Wallet(AsyncWeb3, Account):
         amount: int
     ) -> tuple[bool, str]:
         try:
-            token_contract: AsyncContract = await self.get_contract(token_address)
-            
-            current_allowance = await token_contract.functions.allowance(
-                self.wallet_address, 
-                spender_address
-            ).call()
+            chain_id: int = await self.get_chain_id()
+            token_contract: BoundContract = await self.get_contract(token_address)
+
+            current_allowance: int | None = allowances.get(chain_id, self.wallet_address, token_address, spender_address)
+            if current_allowance is None or current_allowance < amount:
+                current_allowance = await token_contract.functions.allowance(
+                    self.wallet_address,
+                    spender_address
+                ).call()
+                allowances.set(chain_id, self.wallet_address, token_address, spender_address, current_allowance)
 
             if current_allowance >= amount:
+                allowances.spend(chain_id, self.wallet_address, token_address, spender_address, amount)
                 return True, "Allowance already sufficient"
 
             approve_params = await self.build_transaction_params(
@@ -331,45 +553,94 @@ class Wallet(AsyncWeb3, Account):
             if not success:
                 raise WalletError(f"Approval failed: {result}")
 
+            # the receipt has set the cached allowance, the caller is about to spend it
+            allowances.spend(chain_id, self.wallet_address, token_address, spender_address, amount)
             return True, "Approval successful"
 
         except Exception as error:
             return False, f"Error during approval: {str(error)}"
         
+    async def allocate_nonce(self) -> Nonce:
+        chain_id: int = await self.get_chain_id()
+        if not nonce_manager.is_seeded(chain_id, self.wallet_address):
+            nonce_manager.seed(chain_id, self.wallet_address, await self.get_nonce())
+        return nonce_manager.allocate(chain_id, self.wallet_address)
+
+    async def send_transaction(self, transaction: Any, max_attempts: int = 3) -> HexBytes:
+        """
+        Signs and broadcasts the transaction without waiting for its receipt,
+        so several transactions of one account can be in flight at once.
+        A missing nonce is allocated locally; after "nonce too low", "nonce too high"
+        or "replacement transaction underpriced" the address is resynced with the
+        chain, a nonce of a failed broadcast is released.
+        """
+        chain_id: int = await self.get_chain_id()
+        managed: bool = "nonce" not in transaction
+
+        for _ in range(max_attempts):
+            if managed:
+                transaction["nonce"] = await self.allocate_nonce()
+
+            try:
+                signed = await signing_executor.sign_transaction(self.private_key.key, transaction)
+                # journaled before the broadcast, so a resumed run knows it may be on chain
+                record_tx_hash(signed.hash.to_0x_hex())
+                if not self.provider.router:
+                    return await self.eth.send_raw_transaction(signed.raw_transaction)
+
+                accepted_by: str = await self.provider.broadcast_raw_transaction(signed.raw_transaction)
+                log.debug(f"Account: {self.wallet_address} | Transaction {signed.hash.to_0x_hex()} accepted first by {accepted_by}")
+                return HexBytes(signed.hash)
+
+            except Exception as error:
+                error_str = str(error).lower()
+
+                if any(reason in error_str for reason in NONCE_RESYNC_ERRORS):
+                    log.warning(f"Nonce {transaction.get('nonce')} rejected: {error}. Resyncing nonce.")
+                    await self.resync_nonce()
+                    managed = True
+                    continue
+
+                if managed:
+                    nonce_manager.release(chain_id, self.wallet_address, transaction["nonce"])
+                raise
+
+        raise BlockchainError(f"Failed to send transaction after {max_attempts} attempts: nonce rejected")
+
+    async def wait_for_receipt(self, tx_hash: HexBytes, timeout: float = 600) -> TxReceipt:
+        if self.network:
+            return await receipt_watchers.get(self.network).wait(self, tx_hash, timeout)
+        return await self.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+
     async def send_and_verify_transaction(self, transaction: Any) -> tuple[bool, str]:
-        async with self._throttler:
-            max_attempts = 3
-            current_attempt = 0
-            last_error = None
-            
-            while current_attempt < max_attempts:
+        try:
+            tx_hash: HexBytes = await self.send_transaction(transaction)
+            receipt = await self.wait_for_receipt(tx_hash, timeout=600)
+            self._update_gas_profile(transaction, receipt)
+            if self._chain_id is not None:
+                allowances.update_from_receipt(self._chain_id, receipt)
+            return receipt["status"] == 1, tx_hash.hex()
+
+        except Exception as error:
+            log.error(f"Error during sending transaction: {str(error)}")
+            if isinstance(error, TimeExhausted):
+                # the transaction is stuck or dropped, the following ones must not wait behind its nonce
                 try:
-                    signed = self.private_key.sign_transaction(transaction)
-                    tx_hash = await self.eth.send_raw_transaction(signed.raw_transaction)
-                    receipt = await self.eth.wait_for_transaction_receipt(tx_hash, timeout=600)
-                    return receipt["status"] == 1, tx_hash.hex()
-                    
-                except Exception as error:
-                    error_str = str(error)
-                    last_error = error
-                    current_attempt += 1
-                    
-                    if "NONCE_TOO_SMALL" in error_str or "nonce too low" in error_str.lower():
-                        log.warning(f"Nonce too small. Current: {transaction.get('nonce')}. Getting new nonce.")
-                        try:
-                            new_nonce = await self.get_nonce()
-                            transaction['nonce'] = new_nonce
-                        except Exception as nonce_error:
-                            log.error(f"Error during getting new nonce: {str(nonce_error)}")
-                            
-                    else:
-                        log.error(f"Error during sending transaction: {error_str}")
-                        return False, error_str
-                        
-                    await asyncio.sleep(2)
-            
-            return False, f"Failed to execute transaction after {max_attempts} attempts. Last error: {str(last_error)}"
-    
+                    await self.resync_nonce()
+                except Exception as resync_error:
+                    log.warning(f"Failed to resync nonce: {resync_error}")
+            self._update_gas_profile(transaction)
+            return False, str(error)
+
+    def _update_gas_profile(self, transaction: Any, receipt: TxReceipt | None = None) -> None:
+        if self._chain_id is None:
+            return
+
+        if receipt is not None and receipt["status"] == 1:
+            gas_profiles.learn(self._chain_id, transaction.get("to"), transaction.get("data"), receipt["gasUsed"])
+        else:
+            gas_profiles.forget(self._chain_id, transaction.get("to"), transaction.get("data"))
+
     async def _process_transaction(self, transaction: Any) -> tuple[bool, str]:
         try:
             status, result = await self.send_and_verify_transaction(transaction)
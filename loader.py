@@ -1,7 +1,6 @@
-import asyncio
-
+from core.journal import RunJournal
 from models import Config
 from utils import load_config
 
 config: Config = load_config()
-semaphore: asyncio.Semaphore = asyncio.Semaphore()
+journal: RunJournal = RunJournal()
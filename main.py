@@ -1,12 +1,50 @@
+import time
+
+STARTED_AT: float = time.perf_counter()
+
+import argparse
 import asyncio
 import os
 import sys
 
 from logger import log
-from modules_runner import Runner
+from utils.load_config import PRIVATE_KEYS_ENV
+
+IMPORT_BUDGET: float = 1.0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inkchain Bot")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue the last run of the selected module, skipping accounts it already finished",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="with --resume, run again the accounts that were interrupted after sending a transaction",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    run_parser = subparsers.add_parser("run", help="run one module without the interactive menu")
+    run_parser.add_argument("--module", required=True, help="module name, e.g. bridge_relay_ink_to_op")
+    run_parser.add_argument("--accounts", help="path to a private keys file (default: config/data/client/private_keys.txt)")
+    run_parser.add_argument("--shards", type=int, help="override `shards` from settings.yaml")
+    run_parser.add_argument("--resume", action="store_true", default=argparse.SUPPRESS, help="same as the global --resume")
+    run_parser.add_argument("--force", action="store_true", default=argparse.SUPPRESS, help="same as the global --force")
+    run_parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=IMPORT_BUDGET,
+        help=f"warn when startup takes longer than this many seconds (default: {IMPORT_BUDGET})",
+    )
+    return parser.parse_args()
 
 
 async def main():
+    from modules_runner import Runner
+
     log.info(f"✅ Software starts ...")
 
     while True:
@@ -22,8 +60,45 @@ async def main():
     log.info(f"✅ Software stops work ...")
 
 
+async def run_headless(args: argparse.Namespace) -> int:
+    from loader import config
+    from modules_runner import Runner
+    # every worker needs web3, import it here so the startup time covers it
+    import core.wallet
+
+    runner: Runner = Runner()
+    if not runner.is_available(args.module):
+        log.error(f"Module {args.module} is not implemented!")
+        return 2
+
+    startup: float = time.perf_counter() - STARTED_AT
+    if startup > args.import_budget:
+        log.warning(f"Startup took {startup:.3f}s, budget is {args.import_budget:.3f}s")
+    else:
+        log.info(f"Startup took {startup:.3f}s (budget {args.import_budget:.3f}s)")
+
+    config.module = args.module
+    if args.shards is not None:
+        config.shards = args.shards
+
+    results = await runner.run(args.module, config.resume, config.force)
+    return 0 if all(success for success, _ in results) else 1
+
+
 if __name__ == "__main__":
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+    args: argparse.Namespace = parse_args()
+    if getattr(args, "accounts", None):
+        os.environ[PRIVATE_KEYS_ENV] = args.accounts
+
+    from loader import config
+
+    config.resume = args.resume
+    config.force = args.force
+
+    if args.command == "run":
+        sys.exit(asyncio.run(run_headless(args)))
+
     asyncio.run(main())
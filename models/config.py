@@ -1,4 +1,7 @@
 from better_proxy import Proxy
+from eth_account import Account as EthAccount
+from eth_account.signers.local import LocalAccount
+from eth_typing import ChecksumAddress
 from pathlib import Path
 from pydantic import (
     BaseModel,
@@ -8,7 +11,7 @@ from pydantic import (
     field_validator,
     ValidationError
 )
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
 
 from core.exceptions import ConfigurationError
 from logger import log
@@ -21,22 +24,69 @@ class Account:
         "auth_tokens_twitter",
         "auth_tokens_discord",
         "telegram_session",
+        "_signer",
     )
 
     def __init__(
         self,
         private_key: str,
         proxy: Proxy | None = None,
+        signer: LocalAccount | None = None,
         # auth_tokens_twitter: str | None = None,
         # auth_tokens_discord: str | None = None,
         # telegram_session: Path | None = None,
     ) -> None:
         self.private_key: str = private_key
         self.proxy: Proxy | None = proxy
+        self._signer: LocalAccount | None = signer
         # self.auth_tokens_twitter: str | None = auth_tokens_twitter
         # self.auth_tokens_discord: str | None = auth_tokens_discord
         # self.telegram_session: Path | None = telegram_session
 
+    @property
+    def signer(self) -> LocalAccount:
+        # derived once at config load, see ConfigLoader
+        if self._signer is None:
+            self._signer = EthAccount.from_key(self.private_key)
+        return self._signer
+
+    @property
+    def address(self) -> ChecksumAddress:
+        return self.signer.address
+
+
+class AccountTable:
+    """
+    Accounts of the run indexed by address
+    """
+    __slots__ = (
+        "_accounts",
+    )
+
+    def __init__(self, accounts: Iterable[Account] = ()) -> None:
+        self._accounts: Dict[str, Account] = {}
+        for account in accounts:
+            self.add(account)
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def __iter__(self) -> Iterator[Account]:
+        return iter(self._accounts.values())
+
+    def __contains__(self, address: str) -> bool:
+        return address.lower() in self._accounts
+
+    def add(self, account: Account) -> bool:
+        address: str = account.address.lower()
+        if address in self._accounts:
+            return False
+        self._accounts[address] = account
+        return True
+
+    def get(self, address: str) -> Account | None:
+        return self._accounts.get(address.lower())
+
 
 class DelayRange(BaseModel):
     min: int
@@ -76,6 +126,53 @@ class AmountRange(BaseModel):
         return value
 
 
+class CountRange(BaseModel):
+    min: int
+    max: int
+
+    @field_validator('max')
+    @classmethod
+    def validate_max(cls, value: int, info: ValidationInfo) -> int:
+        if value < info.data['min']:
+            raise ConfigurationError('max must be greater than or equal to min')
+        return value
+
+
+class RouteConfig(BaseModel):
+    modules: List[str] = Field(default_factory=list)
+    modules_count: CountRange = CountRange(min=1, max=3)
+    delay_between_modules: DelayRange = DelayRange(min=0, max=0)
+
+
+class LaneConfig(BaseModel):
+    threads: int
+    rate_limit: int | None = None
+    period: float = 1
+
+    @field_validator('threads')
+    @classmethod
+    def validate_threads(cls, value: int) -> int:
+        if value < 1:
+            raise ConfigurationError('lane threads must be greater than or equal to 1')
+        return value
+
+    model_config = ConfigDict(frozen=True)
+
+
+class RateLimitConfig(BaseModel):
+    rate_limit: int
+    period: float = 1
+
+    @field_validator('rate_limit')
+    @classmethod
+    def validate_rate_limit(cls, value: int) -> int:
+        if value < 1:
+            raise ConfigurationError('rate_limit must be greater than or equal to 1')
+        return value
+
+    model_config = ConfigDict(frozen=True)
+
+
 class ModuleConfig(BaseModel):
     percent_range: PersentRange | None = None
     save_amount: AmountRange | None = None
@@ -92,23 +189,55 @@ class ModuleConfig(BaseModel):
 
 class Config(BaseModel):
     accounts: List[Account] = Field(default_factory=list)
+    account_table: AccountTable = Field(default_factory=AccountTable)
     threads: int
     delay_before_start: DelayRange
     delay_between_tasks: DelayRange
     shuffle_flag: bool = False
+    shards: int = 1
     module: str = ""
+    resume: bool = False
+    force: bool = False
 
     percent_range: PersentRange | None = None
     save_amount: AmountRange | None = None
     save_range: PersentRange | None = None
 
     modules_settings: Dict[str, ModuleConfig] = Field(default_factory=dict)
+    lanes: Dict[str, LaneConfig] = Field(default_factory=dict)
+    smart_route: RouteConfig = Field(default_factory=RouteConfig)
+    websocket_rpc: Dict[str, str] = Field(default_factory=dict)
+    rpc_limits: Dict[str, RateLimitConfig] = Field(default_factory=dict)
+    proxy_limit: RateLimitConfig | None = None
+    hedge_reads: bool = False
+    hedge_percentile: float = 95
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         extra='allow',
     )
 
+    @field_validator('threads')
+    @classmethod
+    def validate_threads(cls, value: int) -> int:
+        if value < 1:
+            raise ConfigurationError('threads must be greater than or equal to 1')
+        return value
+
+    @field_validator('hedge_percentile')
+    @classmethod
+    def validate_hedge_percentile(cls, value: float) -> float:
+        if not 0 < value < 100:
+            raise ConfigurationError('hedge_percentile must be between 0 and 100')
+        return value
+
+    @field_validator('shards')
+    @classmethod
+    def validate_shards(cls, value: int) -> int:
+        if value < 0:
+            raise ConfigurationError('shards must be greater than or equal to 0')
+        return value
+
     async def _get_module_settings(self, module_name: str) -> ModuleConfig:
         try:
             module_settings: ModuleConfig | None = self.modules_settings.get(module_name, None)
@@ -1,59 +1,120 @@
 import asyncio
+import multiprocessing
+import os
+import random
+import sys
 
+from collections import defaultdict
+from contextvars import Token
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable, Dict, List, Tuple
 
+from core.allowances import allowances
 from core.bot import InkBot
 from core.exceptions import ConfigurationError
-from console import Console
+from core.journal import JournalEntry, current_entry
+from core.loop_lag import loop_lag
+from core.route import Route, RouteGenerator
+from core.rpc import (
+    chain_states,
+    new_heads,
+    nonce_manager,
+    rate_limits,
+    receipt_watchers,
+    request_coalescer,
+    rpc_routers,
+    rpc_session_pool,
+)
+from core.scheduler import LaneScheduler, PoolStats
+from core.signing import signing_executor
 from interfaces import BaseModuleInfo
 from loader import (
     config,
-    semaphore,
+    journal,
 )
 from logger import log
-from models import Account
-from settings import MODULES_CLASSES
-from utils import (
-    get_address,
-    random_sleep,
+from models import (
+    Account,
+    DelayRange,
+    RouteConfig,
 )
+from settings import MODULES_CLASSES
+from utils import random_sleep
+from utils.load_config import SHARD_PROCESS_ENV
+from utils.networks import NETWORKS, Network, get_network_key
 
 
 async def process_execution(account: Account,
                             selected_module_name: str,
                             process_func: Callable,
+                            run_id: str,
                             ) -> Tuple[bool, str]:
-    address: str = get_address(account.private_key)
+    address: str = account.address
     module_model: BaseModuleInfo | None = MODULES_CLASSES.get(selected_module_name, None)
 
     if not module_model:
         raise ConfigurationError(f"Not found settings for {selected_module_name} module")
 
-    async with semaphore:
-        try:
-            if config.delay_before_start.min > 0:
-                await random_sleep(
-                    address, config.delay_before_start.min, config.delay_before_start.max
-                )
-            result: Tuple[bool, str] = await process_func(account, module_model())
-            success: bool = (
-                result[0]
-                if isinstance(result, tuple) and len(result) == 2
-                else bool(result)
+    journal.start(run_id, selected_module_name, address)
+    # lets the wallet journal the hash of every transaction it signs for this run
+    entry_token: Token = current_entry.set(JournalEntry(journal, run_id, selected_module_name, address))
+    try:
+        result: Tuple[bool, str] = await process_func(account, module_model())
+        success: bool = (
+            result[0]
+            if isinstance(result, tuple) and len(result) == 2
+            else bool(result)
+        )
+        message: str = (
+            result[1]
+            if isinstance(result, tuple) and len(result) == 2
+            else (
+                f"Account: {address} successfully executed {selected_module_name}"
+                if success else f"Account: {address} failed to execute {selected_module_name}"
             )
-            message: str = (
-                result[1]
-                if isinstance(result, tuple) and len(result) == 2
-                else (
-                    f"Account: {address} successfully executed {selected_module_name}"
-                    if success else f"Account: {address} failed to execute {selected_module_name}"
-                )
-            )
-            return success, message
+        )
+
+    except Exception as error:
+        log.error(f"Account: {address} | Error: {error}")
+        success, message = False, str(error)
+
+    finally:
+        current_entry.reset(entry_token)
+
+    journal.finish(run_id, selected_module_name, address, success, message)
+    return success, message
+
+
+@dataclass(slots=True)
+class RunOptions:
+    """
+    Options of one module run, passed to every shard process
+
+    Attributes:
+        run_id: str - id запуска в журнале
+        resume: bool - продолжение прерванного запуска
+        force: bool - повторять шаги, прерванные после отправки транзакции
+    """
+    run_id: str
+    resume: bool = False
+    force: bool = False
+
+
+@lru_cache(maxsize=None)
+def get_module_lane(module: str) -> str:
+    return get_network_key(MODULES_CLASSES[module]().source_network)
+
+
+def _run_shard(module: str,
+               accounts: List[Account],
+               options: RunOptions,
+               ) -> Tuple[List[Tuple[bool, str]], Dict[str, PoolStats]]:
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-        except Exception as error:
-            log.error(f"Account: {address} | Error: {error}")
-            return False, str(error)
+    return asyncio.run(Runner().run_module(module, accounts, options))
 
 
 class Runner:
@@ -64,9 +125,10 @@ class Runner:
     EXCLUDED_MODULES = {
         "exit",
     }
+    SMART_ROUTE_MODULE: str = "smart_route_generate"
 
     def __init__(self) -> None:
-        self.console: Console = Console()
+        self.console = None
 
         self.module_functions: Dict[str, Callable] = {}
 
@@ -76,7 +138,301 @@ class Runner:
                 if module_name not in self.EXCLUDED_MODULES:
                     self.module_functions[module_name] = getattr(InkBot, attr_name)
 
+    @staticmethod
+    def _schedule_accounts(lanes: LaneScheduler,
+                           items: List[Account | Route],
+                           get_lane: Callable[[Account | Route], str],
+                           ) -> None:
+        min_delay, max_delay = config.delay_before_start.min, config.delay_before_start.max
+
+        for item in items:
+            lanes.submit(item, get_lane(item), random.randint(min_delay, max_delay) if min_delay > 0 else 0)
+        lanes.close()
+
+        if min_delay > 0:
+            log.info(f"Scheduled {len(items)} accounts to start within {min_delay} - {max_delay} sec.")
+
+    @staticmethod
+    def _get_resumed_result(options: RunOptions, module: str, address: str) -> Tuple[bool, str] | None:
+        """
+        Returns the result of a module the resumed run must not execute again
+        for the account, None when the module has to run
+        """
+        if not options.resume:
+            return None
+
+        status, tx_hash = journal.get_entry(options.run_id, module, address)
+        if status == "success":
+            return True, f"Account: {address} | {module} already executed in this run"
+
+        if status == "started" and tx_hash:
+            if not options.force:
+                return False, (
+                    f"Account: {address} | Previous {module} run was interrupted after sending {tx_hash}. "
+                    f"Check the transaction and use --force to run it again"
+                )
+            log.warning(f"Account: {address} | Previous {module} run was interrupted after sending {tx_hash}, running it again")
+
+        return None
+
+    def _get_pending_accounts(self,
+                              module: str,
+                              options: RunOptions,
+                              ) -> Tuple[List[Account], List[Tuple[bool, str]]]:
+        """
+        Returns the accounts to run and the failed results of the accounts that
+        were interrupted after sending a transaction and need a manual check
+        """
+        # route steps are journaled under their own modules and checked before each step
+        if not options.resume or module == self.SMART_ROUTE_MODULE:
+            return list(config.account_table), []
+
+        accounts: List[Account] = []
+        interrupted: List[Tuple[bool, str]] = []
+        for account in config.account_table:
+            result: Tuple[bool, str] | None = self._get_resumed_result(options, module, account.address)
+            if result is None:
+                accounts.append(account)
+            elif not result[0]:
+                log.warning(result[1])
+                interrupted.append(result)
+
+        log.info(f"Resuming run {options.run_id} | Skipped {len(config.account_table) - len(accounts)} finished or interrupted accounts")
+        return accounts, interrupted
+
+    @staticmethod
+    def _get_run_id(module: str, resume: bool) -> str:
+        if resume:
+            run_id: str | None = journal.last_run(module)
+            if run_id:
+                return run_id
+            log.warning(f"No previous run of {module} found in the journal, starting a new one")
+
+        return journal.new_run(module)
+
+    @staticmethod
+    def _split_accounts(accounts: List[Account], shards_count: int) -> List[List[Account]]:
+        """
+        Split accounts into shards keeping all accounts of one proxy in the same shard,
+        so every shard keeps its own proxy connections warm.
+        """
+        groups: Dict[str | int, List[Account]] = defaultdict(list)
+        for index, account in enumerate(accounts):
+            groups[account.proxy.as_url if account.proxy else index].append(account)
+
+        shards: List[List[Account]] = [[] for _ in range(min(shards_count, len(groups)))]
+        for group in sorted(groups.values(), key=len, reverse=True):
+            min(shards, key=len).extend(group)
+
+        return shards
+
+    @staticmethod
+    def _get_network(network_key: str, setting: str) -> Network:
+        if network_key not in NETWORKS:
+            raise ConfigurationError(f"Unknown network in {setting}: {network_key}")
+        return NETWORKS[network_key]
+
+    def _open_rpc_state(self) -> None:
+        rate_limits.configure(
+            network_limits={
+                self._get_network(network_key, "rpc_limits").chain_id: (limit.rate_limit, limit.period)
+                for network_key, limit in config.rpc_limits.items()
+            },
+            proxy_limit=(config.proxy_limit.rate_limit, config.proxy_limit.period) if config.proxy_limit else None,
+        )
+        rpc_routers.configure(hedge_percentile=config.hedge_percentile if config.hedge_reads else None)
+
+        for network_key, url in config.websocket_rpc.items():
+            new_heads.start(self._get_network(network_key, "websocket_rpc"), url)
+
+        loop_lag.start()
+
+    @staticmethod
+    async def _close_rpc_state() -> None:
+        for network_name, endpoints in rpc_routers.stats().items():
+            for stats in endpoints:
+                if stats.requests:
+                    log.info(f"{network_name} | RPC {stats}")
+
+        if loop_lag.samples:
+            log.info(str(loop_lag))
+        loop_lag.close()
+        signing_executor.close()
+
+        await new_heads.close()
+        allowances.clear()
+        receipt_watchers.clear()
+        chain_states.clear()
+        nonce_manager.clear()
+        rate_limits.clear()
+        request_coalescer.clear()
+        rpc_routers.clear()
+        await rpc_session_pool.close()
+
+    async def run_module(self,
+                         module: str,
+                         accounts: List[Account],
+                         options: RunOptions,
+                         ) -> Tuple[List[Tuple[bool, str]], Dict[str, PoolStats]]:
+        if module == self.SMART_ROUTE_MODULE:
+            return await self.run_routes(accounts, options)
+
+        results: List[Tuple[bool, str]] = []
+
+        async def process_account(account: Account) -> Tuple[bool, str]:
+            success, message = await process_execution(account, module, self.module_functions[module], options.run_id)
+            if success:
+                log.success(message)
+            else:
+                log.error(message)
+            results.append((success, message))
+            return success, message
+
+        lane: str = get_module_lane(module)
+        lanes: LaneScheduler = LaneScheduler(
+            handler=process_account,
+            default_threads=config.threads,
+            lanes_config=config.lanes,
+        )
+        self._schedule_accounts(lanes, accounts, lambda _: lane)
+
+        self._open_rpc_state()
+        try:
+            return results, await lanes.run()
+        finally:
+            await self._close_rpc_state()
+
+    async def run_routes(self,
+                         accounts: List[Account],
+                         options: RunOptions,
+                         ) -> Tuple[List[Tuple[bool, str]], Dict[str, PoolStats]]:
+        """
+        Run every account through its own module route as a pipeline: after each step
+        the account goes back to the timer heap of the next module's lane, so workers
+        serve other accounts instead of waiting for the next step.
+        A resumed run checks every step in the journal under its own module name.
+        """
+        route_config: RouteConfig = config.smart_route
+        generator: RouteGenerator = RouteGenerator(
+            modules=route_config.modules,
+            available_modules=self.module_functions,
+            min_count=route_config.modules_count.min,
+            max_count=route_config.modules_count.max,
+        )
+        results: List[Tuple[bool, str]] = []
+
+        async def process_step(route: Route) -> Tuple[bool, str]:
+            module: str = route.module
+
+            resumed: Tuple[bool, str] | None = self._get_resumed_result(options, module, route.address)
+            if resumed is None:
+                success, message = await process_execution(route.account, module, self.module_functions[module], options.run_id)
+            else:
+                success, message = resumed
+
+            if success:
+                log.success(message)
+            else:
+                log.error(message)
+
+            if success and route.advance():
+                delay: DelayRange = route_config.delay_between_modules
+                # a step skipped by the resumed run sent nothing, the next one needs no pause
+                lanes.submit(route, get_module_lane(route.module), random.randint(delay.min, delay.max) if resumed is None else 0)
+            elif success:
+                results.append((True, f"Account: {route.address} | Route {route} completed"))
+            else:
+                results.append((False, f"Account: {route.address} | Route {route} stopped at {module}: {message}"))
+
+            return success, message
+
+        lanes: LaneScheduler = LaneScheduler(
+            handler=process_step,
+            default_threads=config.threads,
+            lanes_config=config.lanes,
+        )
+        routes: List[Route] = [
+            generator.generate(account, account.address, options.run_id)
+            for account in accounts
+        ]
+        for route in routes:
+            log.info(f"Account: {route.address} | Route: {route}")
+
+        self._schedule_accounts(lanes, routes, lambda route: get_module_lane(route.module))
+
+        self._open_rpc_state()
+        try:
+            return results, await lanes.run()
+        finally:
+            await self._close_rpc_state()
+
+    async def run_sharded(self,
+                          module: str,
+                          accounts: List[Account],
+                          shards_count: int,
+                          options: RunOptions,
+                          ) -> Tuple[List[Tuple[bool, str]], Dict[str, PoolStats]]:
+        shards: List[List[Account]] = self._split_accounts(accounts, shards_count)
+        log.info(f"Running {module} in {len(shards)} shards: {', '.join(str(len(shard)) for shard in shards)} accounts")
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        # spawned shards inherit the environment and skip reading the key and proxy files
+        os.environ[SHARD_PROCESS_ENV] = "1"
+        try:
+            with ProcessPoolExecutor(max_workers=len(shards), mp_context=multiprocessing.get_context("spawn")) as executor:
+                outputs = await asyncio.gather(*[
+                    loop.run_in_executor(executor, _run_shard, module, shard, options)
+                    for shard in shards
+                ])
+        finally:
+            os.environ.pop(SHARD_PROCESS_ENV, None)
+
+        results: List[Tuple[bool, str]] = []
+        lanes_stats: Dict[str, PoolStats] = {}
+        for index, (shard_results, shard_stats) in enumerate(outputs):
+            results.extend(shard_results)
+            for lane_name, stats in shard_stats.items():
+                lanes_stats[f"{lane_name} #{index + 1}"] = stats
+
+        return results, lanes_stats
+
+    @staticmethod
+    def _log_summary(module: str, results: List[Tuple[bool, str]], lanes_stats: Dict[str, PoolStats]) -> None:
+        for lane_name, stats in lanes_stats.items():
+            log.info(
+                f"Module {module} finished in lane {lane_name} | Success: {stats.succeeded} | "
+                f"Failed: {stats.failed} | Peak queue depth: {stats.peak_queue_depth} | "
+                f"Utilisation: {stats.utilisation:.0%} | Elapsed: {stats.elapsed:.1f}s"
+            )
+
+        succeeded: int = sum(1 for success, _ in results if success)
+        log.info(f"Module {module} summary | Accounts: {len(results)} | Success: {succeeded} | Failed: {len(results) - succeeded}")
+
+    def is_available(self, module: str) -> bool:
+        return module in self.module_functions or module == self.SMART_ROUTE_MODULE
+
+    async def run(self, module: str, resume: bool = False, force: bool = False) -> List[Tuple[bool, str]]:
+        shards_count: int = config.shards or os.cpu_count() or 1
+        options: RunOptions = RunOptions(
+            run_id=self._get_run_id(module, resume),
+            resume=resume,
+            force=force,
+        )
+        accounts, interrupted = self._get_pending_accounts(module, options)
+
+        if shards_count > 1 and len(accounts) > 1:
+            results, lanes_stats = await self.run_sharded(module, accounts, shards_count, options)
+        else:
+            results, lanes_stats = await self.run_module(module, accounts, options)
+        results = interrupted + results
+
+        self._log_summary(module, results, lanes_stats)
+        return results
+
     async def execute(self) -> bool:
+        from console import Console
+
+        self.console = self.console or Console()
         self.console.build()
 
         match config.module:
@@ -84,25 +440,8 @@ class Runner:
                 log.info("❗️ Exiting software ...")
                 return True
 
-            case module if module in self.module_functions:
-                async def process_account(account):
-                    success, message = await process_execution(account, module, self.module_functions[config.module])
-                    if success:
-                        log.success(message)
-                    else:
-                        log.error(message)
-                    return success, message
-
-                tasks: List[asyncio.Task] = []
-                async with asyncio.TaskGroup() as tg:
-                    for account in config.accounts:
-                        tasks.append(tg.create_task(coro=process_account(account)))
-
-                results: List[asyncio.Future] = [task.result() for task in tasks]
-
-                # for result in results:
-                #     if result.cancelled():
-                #         result.cancel()
+            case module if self.is_available(module):
+                await self.run(module, config.resume, config.force)
 
                 if config.delay_between_tasks.min > 0:
                     await random_sleep(
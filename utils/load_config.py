@@ -1,19 +1,50 @@
+import getpass
 import yaml
+import multiprocessing
 import os
 import random
+import time
 
 from better_proxy import Proxy
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from eth_account import Account as EthAccount
+from eth_keyfile import extract_key_from_keyfile
+from eth_account.signers.local import LocalAccount
+from functools import partial
 from itertools import cycle
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
-from typing import Any, Dict, Generator, List
+from typing import Any, Dict, Generator, List, Tuple
 
 from core.exceptions import ConfigurationError
-from models import Account, Config
+from models import Account, AccountTable, Config
 from logger import log
 
 
+PRIVATE_KEYS_ENV: str = "INKBOT_PRIVATE_KEYS"
+KEYSTORES_ENV: str = "INKBOT_KEYSTORES"
+KEYSTORE_PASSWORD_ENV: str = "INKBOT_KEYSTORE_PASSWORD"
+# set by the parent for its shard processes, they get their accounts from it
+SHARD_PROCESS_ENV: str = "INKBOT_SHARD_PROCESS"
+# below this many keys a process pool costs more to start than it saves
+PARALLEL_DERIVATION_THRESHOLD: int = 1000
+
+
+def _derive_signer(private_key: str) -> LocalAccount | str:
+    try:
+        return EthAccount.from_key(private_key)
+    except Exception as error:
+        return str(error)
+
+
+def _decrypt_keystore(path: Path, password: bytes) -> LocalAccount | str:
+    try:
+        return EthAccount.from_key(extract_key_from_keyfile(str(path), password))
+    except Exception as error:
+        return str(error)
+
+
 @dataclass
 class FileData:
     path: Path
@@ -27,9 +58,11 @@ class ConfigLoader:
         self.config_path: Path = self.base_path / "config"
         self.data_client_path: Path = self.config_path / "data" / "client"
         self.settings_path: Path = self.config_path / "settings.yaml"
+        self.keystores_path: Path = Path(os.environ.get(KEYSTORES_ENV) or self.data_client_path / "keystores")
         self.file_path: Dict[str, FileData] = {
             "private_keys": FileData(
-                self.data_client_path / "private_keys.txt"
+                Path(os.environ.get(PRIVATE_KEYS_ENV) or self.data_client_path / "private_keys.txt"),
+                required=not self._list_keystores(),
             ),
             "proxies": FileData(
                 self.data_client_path / "proxies.txt",
@@ -109,6 +142,62 @@ class ConfigLoader:
             if proxy is not None
         ]
 
+    def _list_keystores(self) -> List[Path]:
+        if not self.keystores_path.is_dir():
+            return []
+
+        return sorted(
+            path
+            for path in self.keystores_path.iterdir()
+            if path.is_file() and not path.name.startswith(".")
+        )
+
+    @staticmethod
+    def _get_keystore_password() -> bytes:
+        password: str | None = os.environ.get(KEYSTORE_PASSWORD_ENV)
+        if password is None:
+            password = getpass.getpass("Keystore password: ")
+        return password.encode()
+
+    def _decrypt_keystores(self) -> List[Tuple[Path, LocalAccount | str]]:
+        """
+        Decrypts V3 keystores on all cores. The keys are kept in memory only,
+        for the life of the process
+        """
+        paths: List[Path] = self._list_keystores()
+        if not paths:
+            return []
+
+        password: bytes = self._get_keystore_password()
+        started_at: float = time.perf_counter()
+
+        workers: int = min(os.cpu_count() or 1, len(paths))
+        if workers == 1:
+            signers: List[LocalAccount | str] = [_decrypt_keystore(path, password) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                signers = list(executor.map(partial(_decrypt_keystore, password=password), paths))
+
+        log.info(f"Decrypted {len(paths)} keystores in {time.perf_counter() - started_at:.1f}s on {workers} processes")
+        return list(zip(paths, signers))
+
+    @staticmethod
+    def _derive_signers(private_keys: List[str]) -> List[LocalAccount | str]:
+        """
+        Derives the account of every private key once, on all cores for large key files;
+        errors are returned as strings in place of the account
+        """
+        workers: int = os.cpu_count() or 1
+        if workers == 1 or len(private_keys) < PARALLEL_DERIVATION_THRESHOLD:
+            return [_derive_signer(private_key) for private_key in private_keys]
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            return list(executor.map(
+                _derive_signer,
+                private_keys,
+                chunksize=max(1, len(private_keys) // (workers * 4)),
+            ))
+
     def _get_accounts(self) -> Generator[Account, None, None]:
         proxies: List[Proxy] = self._parse_proxies()
         proxy_cycle = cycle(proxies) if proxies else None
@@ -121,21 +210,47 @@ class ConfigLoader:
                 ]
             )
 
-        for index, private_key in enumerate(private_keys):
-            try:
-                yield Account(
-                    private_key=private_key,
-                    proxy=next(proxy_cycle) if proxy_cycle else None,
-                )
+        started_at: float = time.perf_counter()
+        signers: List[LocalAccount | str] = self._derive_signers(private_keys)
+        log.debug(f"Derived {len(signers)} accounts in {time.perf_counter() - started_at:.3f}s")
 
-            except Exception as error:
-                log.error(
-                    f"Failed to create account for {private_key} private key: {error}"
-                )
+        for index, (private_key, signer) in enumerate(zip(private_keys, signers)):
+            if isinstance(signer, str):
+                log.error(f"Failed to create account for private key #{index + 1}: {signer}")
+                continue
+
+            yield Account(
+                private_key=private_key,
+                proxy=next(proxy_cycle) if proxy_cycle else None,
+                signer=signer,
+            )
+
+        for path, signer in self._decrypt_keystores():
+            if isinstance(signer, str):
+                log.error(f"Failed to decrypt keystore {path.name}: {signer}")
+                continue
+
+            yield Account(
+                private_key=signer.key.to_0x_hex(),
+                proxy=next(proxy_cycle) if proxy_cycle else None,
+                signer=signer,
+            )
+
+    @staticmethod
+    def _build_account_table(accounts: List[Account]) -> AccountTable:
+        table: AccountTable = AccountTable()
+        for account in accounts:
+            if not table.add(account):
+                log.warning(f"Account: {account.address} | Duplicate private key, skipped")
+        return table
 
     def load(self) -> Config:
         try:
             config: Dict[str, Any] = self._load_yaml()
+            if os.environ.get(SHARD_PROCESS_ENV):
+                # the accounts of a shard are passed in by the parent process
+                return Config(**config)
+
             accounts: List[Account] = list(self._get_accounts())
 
             if not accounts:
@@ -146,7 +261,7 @@ class ConfigLoader:
             if config.get("shuffle_flag"):
                 random.shuffle(accounts)
 
-            return Config(accounts=accounts, **config)
+            return Config(accounts=accounts, account_table=self._build_account_table(accounts), **config)
 
         except ConfigurationError as error:
             log.error(f"Configuration error: {error}")
@@ -10,7 +10,8 @@ class Network:
             eip1559_support: bool,
             token: str,
             explorer: str,
-            decimals: int = 18
+            decimals: int = 18,
+            block_time: float = 2,
     ):
         self.name: str = name
         self.rpc: List[str] = rpc
@@ -19,6 +20,7 @@ class Network:
         self.token: str = token
         self.explorer: str = explorer
         self.decimals: int = decimals
+        self.block_time: float = block_time
 
 
 Ethereum = Network(
@@ -34,6 +36,7 @@ Ethereum = Network(
     eip1559_support=True,
     token='ETH',
     explorer='https://etherscan.io/',
+    block_time=12,
 )
 
 Ink = Network(
@@ -45,6 +48,7 @@ Ink = Network(
     eip1559_support=True,
     token='ETH',
     explorer='https://explorer.inkonchain.com/',
+    block_time=1,
 )
 
 Base = Network(
@@ -69,3 +73,18 @@ OP = Network(
     token='ETH',
     explorer='https://optimistic.etherscan.io/',
 )
+
+
+NETWORKS: Dict[str, Network] = {
+    "Ethereum": Ethereum,
+    "Ink": Ink,
+    "Base": Base,
+    "OP": OP,
+}
+
+
+def get_network_key(network: Network) -> str:
+    for key, value in NETWORKS.items():
+        if value is network:
+            return key
+    return network.name